@@ -9,6 +9,12 @@ tests_dir = str(Path(__file__).parent / "tests")
 if tests_dir in sys.path:
     sys.path.remove(tests_dir)
 
+# Source tree of the rye package, for test modules that import it without
+# an installed copy
+_rye_src = str(Path(__file__).parent / "rye")
+if _rye_src not in sys.path:
+    sys.path.insert(0, _rye_src)
+
 # Runtime lib paths — mirrors what the anchor system injects via PYTHONPATH
 # at execution time. Tests that load tool modules via importlib need these.
 _runtime_lib = str(Path(__file__).parent / "rye" / "rye" / ".ai" / "tools" / "rye" / "core" / "runtimes" / "lib" / "python")
@@ -79,7 +79,7 @@ class HttpClientPrimitive:
 
     async def _execute_sync(self, config: Dict[str, Any], params: Dict[str, Any]) -> HttpResult:
         """Execute a synchronous HTTP request."""
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         try:
             method = config.get("method", "GET").upper()
@@ -135,7 +135,7 @@ class HttpClientPrimitive:
                     except (json.JSONDecodeError, ValueError):
                         response_body = response.text
 
-                    duration_ms = int((time.time() - start_time) * 1000)
+                    duration_ms = int((time.perf_counter() - start_time) * 1000)
                     success = 200 <= response.status_code < 400
                     error_msg = None if success else f"HTTP {response.status_code}: {response.reason_phrase}"
 
@@ -155,7 +155,7 @@ class HttpClientPrimitive:
                     delay = 2**attempt if backoff == "exponential" else 1
                     await asyncio.sleep(delay)
 
-            duration_ms = int((time.time() - start_time) * 1000)
+            duration_ms = int((time.perf_counter() - start_time) * 1000)
             return HttpResult(
                 success=False,
                 status_code=0,
@@ -166,7 +166,7 @@ class HttpClientPrimitive:
             )
 
         except Exception as e:
-            duration_ms = int((time.time() - start_time) * 1000)
+            duration_ms = int((time.perf_counter() - start_time) * 1000)
             return HttpResult(
                 success=False,
                 status_code=0,
@@ -178,7 +178,7 @@ class HttpClientPrimitive:
 
     async def _execute_stream(self, config: Dict[str, Any], params: Dict[str, Any]) -> HttpResult:
         """Execute streaming HTTP request (SSE) with destination fan-out."""
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         try:
             sinks = params.pop("__sinks", [])
@@ -244,7 +244,7 @@ class HttpClientPrimitive:
                     if return_sink:
                         body = return_sink.get_events()
 
-                duration_ms = int((time.time() - start_time) * 1000)
+                duration_ms = int((time.perf_counter() - start_time) * 1000)
                 success = 200 <= response.status_code < 400
                 error_msg = None if success else f"HTTP {response.status_code}: {response.reason_phrase}"
 
@@ -267,7 +267,7 @@ class HttpClientPrimitive:
                 except Exception:
                     pass
 
-            duration_ms = int((time.time() - start_time) * 1000)
+            duration_ms = int((time.perf_counter() - start_time) * 1000)
             return HttpResult(
                 success=False,
                 status_code=0,
@@ -10,6 +10,10 @@ import time
 from dataclasses import dataclass
 from typing import Dict, Any, List
 
+# Pattern: ${VAR_NAME:-default_value} or ${VAR_NAME}
+_ENV_VAR_RE = re.compile(r'\$\{([^}]+)\}')
+_PARAM_RE = re.compile(r'\{([^}]+)\}')
+
 
 @dataclass
 class SubprocessResult:
@@ -61,7 +65,7 @@ class SubprocessPrimitive:
         Returns:
             SubprocessResult with execution details.
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         try:
             # Extract config
@@ -98,7 +102,7 @@ class SubprocessPrimitive:
                     stdout="",
                     stderr="No command specified",
                     return_code=-1,
-                    duration_ms=(time.time() - start_time) * 1000,
+                    duration_ms=(time.perf_counter() - start_time) * 1000,
                 )
 
             # Build command args
@@ -127,7 +131,7 @@ class SubprocessPrimitive:
                     # Kill the process on timeout
                     process.kill()
                     await process.wait()
-                    duration_ms = (time.time() - start_time) * 1000
+                    duration_ms = (time.perf_counter() - start_time) * 1000
                     return SubprocessResult(
                         success=False,
                         stdout="",
@@ -140,7 +144,7 @@ class SubprocessPrimitive:
 
             except FileNotFoundError:
                 # Command not found
-                duration_ms = (time.time() - start_time) * 1000
+                duration_ms = (time.perf_counter() - start_time) * 1000
                 return SubprocessResult(
                     success=False,
                     stdout="",
@@ -149,7 +153,7 @@ class SubprocessPrimitive:
                     duration_ms=duration_ms,
                 )
 
-            duration_ms = (time.time() - start_time) * 1000
+            duration_ms = (time.perf_counter() - start_time) * 1000
 
             return SubprocessResult(
                 success=return_code == 0,
@@ -161,7 +165,7 @@ class SubprocessPrimitive:
 
         except Exception as e:
             # Unexpected error
-            duration_ms = (time.time() - start_time) * 1000
+            duration_ms = (time.perf_counter() - start_time) * 1000
             return SubprocessResult(
                 success=False,
                 stdout="",
@@ -180,7 +184,7 @@ class SubprocessPrimitive:
         Returns:
             Text with variables expanded.
         """
-        if not text:
+        if not text or "${" not in text:
             return text
 
         def replace_var(match):
@@ -194,8 +198,7 @@ class SubprocessPrimitive:
             
             return env.get(var_name, default)
 
-        # Pattern: ${VAR_NAME:-default_value} or ${VAR_NAME}
-        return re.sub(r'\$\{([^}]+)\}', replace_var, text)
+        return _ENV_VAR_RE.sub(replace_var, text)
 
     def _template_params(self, text: str, params: Dict[str, Any]) -> str:
         """Substitute {param_name} with parameter values.
@@ -209,7 +212,7 @@ class SubprocessPrimitive:
         Returns:
             Text with parameters substituted (missing ones unchanged).
         """
-        if not text:
+        if not text or "{" not in text:
             return text
 
         def replace_param(match):
@@ -218,7 +221,7 @@ class SubprocessPrimitive:
                 return str(params[param_name])
             return match.group(0)  # Leave unchanged
 
-        return re.sub(r'\{([^}]+)\}', replace_param, text)
+        return _PARAM_RE.sub(replace_param, text)
 
     def _prepare_env(self, config_env: Dict[str, str]) -> Dict[str, str]:
         """Prepare process environment.
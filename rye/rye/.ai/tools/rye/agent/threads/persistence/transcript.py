@@ -1,4 +1,4 @@
-# rye:signed:2026-02-14T00:28:39Z:542f03f548d29464800e9bbd69d0499950d600f2e085f655cbe75a4634a3aa53:TbCgo_ZshG5u2BB2MMilorPFJCd9LajBobkS-l40eR6V6dpISNA0w7e5bW1equyZ-MNXl7VIVArVlzVkxc8OBQ==:440443d0858f0199
+# rye:signed:2026-10-16T00:25:36Z:fba9d92f17c1fdbe57714de8ff22fcf84074d751e18e2d0f842aee69aeaa604c:AmJdqbgor1FYxYKvNVFWxdn1o0mmpAfW6-xIPA2rNVcX7befqbjy3gemeTmWVQUlURPBz77JKnAG5Mjy_L2WDA==:fef13f1ec431a840
 """
 persistence/transcript.py: Thread execution transcript (JSONL)
 
@@ -15,7 +15,7 @@ __tool_description__ = "Thread transcript JSONL persistence"
 import json
 import time
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, BinaryIO, Callable, Dict, List, Optional, TextIO
 
 from rye.constants import AI_DIR
 
@@ -25,6 +25,10 @@ class Transcript:
 
     Each event is written as a single JSON line, flushed immediately.
     This survives crashes — partial transcripts are still readable.
+
+    The JSONL and markdown files are opened on first write and kept open
+    for the life of the thread; call close() when the thread finishes.
+    A write after close() reopens the files.
     """
 
     def __init__(self, thread_id: str, project_path: Path):
@@ -33,6 +37,8 @@ class Transcript:
         self._dir.mkdir(parents=True, exist_ok=True)
         self._path = self._dir / "transcript.jsonl"
         self._events: List[Dict[str, Any]] = []
+        self._jsonl_fh: Optional[TextIO] = None
+        self._md_fh: Optional[TextIO] = None
 
     def write_event(self, thread_id: str, event_type: str, payload: Dict) -> None:
         """Append event to JSONL file, in-memory list, and stream to transcript.md."""
@@ -43,22 +49,35 @@ class Transcript:
             "payload": payload,
         }
         self._events.append(entry)
-        with open(self._path, "a") as f:
-            f.write(json.dumps(entry, default=str) + "\n")
-            f.flush()
+        if self._jsonl_fh is None or self._jsonl_fh.closed:
+            self._jsonl_fh = open(self._path, "a", encoding="utf-8")
+        self._jsonl_fh.write(json.dumps(entry, default=str) + "\n")
+        self._jsonl_fh.flush()
 
         # Stream markdown chunk to transcript.md
         chunk = self._render_event(entry)
         if chunk:
-            md_path = self._dir / "transcript.md"
-            with open(md_path, "a", encoding="utf-8") as f:
-                f.write(chunk)
-                f.flush()
+            if self._md_fh is None or self._md_fh.closed:
+                self._md_fh = open(self._dir / "transcript.md", "a", encoding="utf-8")
+            self._md_fh.write(chunk)
+            self._md_fh.flush()
+
+    def close(self) -> None:
+        """Close the open transcript files."""
+        for fh in (self._jsonl_fh, self._md_fh):
+            if fh is not None:
+                fh.close()
+        self._jsonl_fh = None
+        self._md_fh = None
 
     def get_events(self) -> List[Dict[str, Any]]:
         """Return accumulated events."""
         return list(self._events)
 
+    def tail(self, n: int) -> List[Dict[str, Any]]:
+        """Return the last n events in transcript.jsonl (see read_tail)."""
+        return read_tail(self._path, n)
+
     def reconstruct_messages(self) -> Optional[List[Dict]]:
         """Reconstruct conversation messages from transcript.jsonl.
 
@@ -137,62 +156,178 @@ class Transcript:
     @staticmethod
     def _render_event(event: Dict) -> str:
         """Render a single event to markdown fragment."""
-        event_type = event.get("event_type", "")
-        payload = event.get("payload", {})
-
-        if event_type == "thread_started":
-            return (
-                f"# {payload.get('directive', 'Thread')}\n\n"
-                f"**Thread ID:** `{event.get('thread_id', '')}`\n"
-                f"**Model:** {payload.get('model', 'unknown')}\n"
-                f"**Started:** {event.get('timestamp', '')}\n\n---\n\n"
-            )
-
-        if event_type == "cognition_in":
-            role = payload.get("role", "user")
-            if role == "tool":
-                return ""
-            return f"## {role.title()}\n\n{payload.get('text', '')}\n\n---\n\n"
-
-        if event_type == "cognition_out":
-            text = payload.get("text", "")
-            return f"**Assistant:**\n\n{text}\n\n"
-
-        if event_type == "tool_call_start":
-            tool = payload.get("tool", "unknown")
-            call_id = payload.get("call_id", "?")
-            input_data = payload.get("input", {})
-            try:
-                input_str = json.dumps(input_data, indent=2)
-            except Exception:
-                input_str = str(input_data)
-            return (
-                f"**Tool Call:** `{tool}` (ID: `{call_id}`)\n\n"
-                f"```json\n{input_str}\n```\n\n"
-            )
-
-        if event_type == "tool_call_result":
-            call_id = payload.get("call_id", "?")
-            output = payload.get("output", "")
-            error = payload.get("error")
-            result = f"**Tool Result** (ID: `{call_id}`)\n\n"
-            if error:
-                result += f"**Error:** {error}\n\n"
-            else:
-                result += f"```\n{output}\n```\n\n"
-            return result
-
-        if event_type == "thread_completed":
-            cost = payload.get("cost", {})
-            tokens = cost.get("input_tokens", 0) + cost.get("output_tokens", 0)
-            spend = cost.get("spend", 0)
-            return (
-                f"## Completed\n\n"
-                f"**Total Tokens:** {tokens}\n"
-                f"**Total Cost:** ${spend:.6f}\n\n"
-            )
-
-        if event_type == "thread_error":
-            return f"## Error\n\n{payload.get('error', 'unknown')}\n\n"
+        render = _EVENT_RENDERERS.get(event.get("event_type", ""))
+        if render is None:
+            return ""
+        return render(event, event.get("payload", {}))
+
+
+_TAIL_BLOCK_SIZE = 8192
+
+
+def read_tail(
+    path: Path, n: int, block_size: int = _TAIL_BLOCK_SIZE
+) -> List[Dict[str, Any]]:
+    """Return the last n events of a transcript.jsonl file.
 
+    Reads backwards from EOF in block_size chunks until n complete lines
+    are buffered, so peeking at a long-running thread costs the size of
+    the tail rather than the whole file. A final line without its newline
+    is still being written and is left out; unparseable lines are skipped.
+    """
+    if n <= 0 or not path.exists():
+        return []
+
+    # Blocks in reverse file order; joined once at the end
+    blocks: List[bytes] = []
+    newlines = 0
+    with open(path, "rb") as f:
+        pos = f.seek(0, 2)
+        # n lines need n + 1 newlines unless the scan reaches the start
+        while pos > 0 and newlines <= n:
+            step = min(block_size, pos)
+            pos -= step
+            f.seek(pos)
+            block = f.read(step)
+            blocks.append(block)
+            newlines += block.count(b"\n")
+
+    blocks.reverse()
+    lines = b"".join(blocks).split(b"\n")
+    # The last piece is empty, or a line still being written
+    lines.pop()
+    if pos > 0:
+        # The first line is (or may be) cut off by the block boundary
+        lines = lines[1:]
+
+    events = []
+    for line in lines:
+        if not line.strip():
+            continue
+        try:
+            events.append(json.loads(line))
+        except json.JSONDecodeError:
+            continue
+    return events[-n:]
+
+
+class TranscriptWatcher:
+    """Incremental reader for a transcript.jsonl being written by a thread.
+
+    The file is opened on the first poll that finds it and kept open, so
+    each poll() reads only the bytes appended since the previous one. A
+    trailing line without its newline is still being written; it stays in
+    the tail buffer until the rest of it arrives. Call close() when done.
+    """
+
+    def __init__(self, path: Path):
+        self._path = path
+        self._fh: Optional[BinaryIO] = None
+        self._tail = bytearray()
+
+    def poll(self) -> List[Dict[str, Any]]:
+        """Return the events completed since the last poll."""
+        if self._fh is None:
+            try:
+                self._fh = open(self._path, "rb")
+            except FileNotFoundError:
+                return []
+        self._tail += self._fh.read()
+
+        events = []
+        start = 0
+        while True:
+            nl = self._tail.find(b"\n", start)
+            if nl == -1:
+                break
+            line = bytes(self._tail[start:nl])
+            start = nl + 1
+            if not line.strip():
+                continue
+            try:
+                events.append(json.loads(line))
+            except json.JSONDecodeError:
+                continue
+        # Drop consumed lines in one go rather than once per line
+        del self._tail[:start]
+        return events
+
+    def close(self) -> None:
+        """Close the transcript file."""
+        if self._fh is not None:
+            self._fh.close()
+            self._fh = None
+
+
+def _render_thread_started(event: Dict, payload: Dict) -> str:
+    return (
+        f"# {payload.get('directive', 'Thread')}\n\n"
+        f"**Thread ID:** `{event.get('thread_id', '')}`\n"
+        f"**Model:** {payload.get('model', 'unknown')}\n"
+        f"**Started:** {event.get('timestamp', '')}\n\n---\n\n"
+    )
+
+
+def _render_cognition_in(event: Dict, payload: Dict) -> str:
+    role = payload.get("role", "user")
+    if role == "tool":
         return ""
+    return f"## {role.title()}\n\n{payload.get('text', '')}\n\n---\n\n"
+
+
+def _render_cognition_out(event: Dict, payload: Dict) -> str:
+    text = payload.get("text", "")
+    return f"**Assistant:**\n\n{text}\n\n"
+
+
+def _render_tool_call_start(event: Dict, payload: Dict) -> str:
+    tool = payload.get("tool", "unknown")
+    call_id = payload.get("call_id", "?")
+    input_data = payload.get("input", {})
+    try:
+        input_str = json.dumps(input_data, indent=2)
+    except Exception:
+        input_str = str(input_data)
+    return (
+        f"**Tool Call:** `{tool}` (ID: `{call_id}`)\n\n"
+        f"```json\n{input_str}\n```\n\n"
+    )
+
+
+def _render_tool_call_result(event: Dict, payload: Dict) -> str:
+    call_id = payload.get("call_id", "?")
+    output = payload.get("output", "")
+    error = payload.get("error")
+    result = f"**Tool Result** (ID: `{call_id}`)\n\n"
+    if error:
+        result += f"**Error:** {error}\n\n"
+    else:
+        result += f"```\n{output}\n```\n\n"
+    return result
+
+
+def _render_thread_completed(event: Dict, payload: Dict) -> str:
+    cost = payload.get("cost", {})
+    tokens = cost.get("input_tokens", 0) + cost.get("output_tokens", 0)
+    spend = cost.get("spend", 0)
+    return (
+        f"## Completed\n\n"
+        f"**Total Tokens:** {tokens}\n"
+        f"**Total Cost:** ${spend:.6f}\n\n"
+    )
+
+
+def _render_thread_error(event: Dict, payload: Dict) -> str:
+    return f"## Error\n\n{payload.get('error', 'unknown')}\n\n"
+
+
+# Markdown renderers by event_type; unlisted events render nothing.
+_EVENT_RENDERERS: Dict[str, Callable[[Dict, Dict], str]] = {
+    "thread_started": _render_thread_started,
+    "cognition_in": _render_cognition_in,
+    "cognition_out": _render_cognition_out,
+    "tool_call_start": _render_tool_call_start,
+    "tool_call_result": _render_tool_call_result,
+    "thread_completed": _render_thread_completed,
+    "thread_error": _render_thread_error,
+}
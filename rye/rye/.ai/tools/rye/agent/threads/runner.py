@@ -1,4 +1,4 @@
-# rye:signed:2026-02-14T00:28:39Z:e03fd03b94cf119b5cef6f44297004c683eb5d3f3efb4925f4c4e00f00988a92:bzfYA-QGiL1EKIuOM1GLJrjzu722SUmDJxgOCo15wgUZRYCUjyY6UJM5PN4QTvjMYJ374uZvJG89HrqA5ahJCg==:440443d0858f0199
+# rye:signed:2026-10-15T23:46:53Z:dc91be9af9993b9cff45b659e731719afea5db0b2e3e62f78e7814ff6806b239:zXirKirhEwmxfbgG9sCc6M7g26-bwpMi6Pvmm3W1dDPv_rp7wy45tdzQQS3c6zIftR_pNMEzP1Y6WmNfmjFaAw==:fef13f1ec431a840
 """
 runner.py: Core LLM loop for thread execution
 
@@ -267,7 +267,10 @@ async def run(
             **cost,
             "status": "completed" if cost.get("turns") else "error",
         }
-        orchestrator.complete_thread(thread_id, final)
+        try:
+            orchestrator.complete_thread(thread_id, final)
+        finally:
+            transcript.close()
 
 
 def _finalize(thread_id, cost, result, emitter, transcript) -> Dict:
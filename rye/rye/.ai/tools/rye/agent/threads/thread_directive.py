@@ -1,4 +1,4 @@
-# rye:signed:2026-02-14T00:28:39Z:43298b65ef5614023b37be19f23423c82d8d3d0ef473901fdaa6aa0646f4fec7:AXBja0PigzHdSpJMrmuiXPGwm71sX4MNtzaNkZaihHOZD1DKtaI15hI5sPwvQFzPHw_rE3IoVXqjD0yyLuJoAw==:440443d0858f0199
+# rye:signed:2026-10-15T23:47:19Z:281e10994fd8257bdf797e8d86d74aa7f4079c974ec15741286da6e368594854:W507p1Ajtuc1Py6ZApPWVkL__NsZHmSjJ-pYisrT1rrQGEsoSIQg55-tjr2PA_TgPVdsEZ-6sl41gLoCnm6AAA==:fef13f1ec431a840
 __version__ = "1.0.0"
 __tool_type__ = "python"
 __executor_id__ = "rye/core/runtimes/python_script_runtime"
@@ -121,7 +121,7 @@ def _write_thread_meta(
     tmp_path = meta_path.with_suffix(".json.tmp")
     with open(tmp_path, "w", encoding="utf-8") as f:
         json.dump(meta, f, indent=2)
-    tmp_path.rename(meta_path)
+    tmp_path.replace(meta_path)
 
 
 def _read_thread_meta(project_path: Path, thread_id: str) -> Optional[Dict]:
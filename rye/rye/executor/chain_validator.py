@@ -7,14 +7,28 @@ Ensures:
     - Version constraints satisfaction
 """
 
+import functools
 import logging
+import operator
 from dataclasses import dataclass, field
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 from packaging import version
 
 logger = logging.getLogger(__name__)
 
+_VERSION_OPERATORS = {
+    ">=": operator.ge,
+    "<=": operator.le,
+    "==": operator.eq,
+    ">": operator.gt,
+    "<": operator.lt,
+    "!=": operator.ne,
+}
+
+# The same versions recur across chains; Version objects are immutable
+_parse_version = functools.lru_cache(maxsize=2048)(version.parse)
+
 
 @dataclass
 class ChainValidationResult:
@@ -72,17 +86,24 @@ class ChainValidator:
             # Single element chain (primitive) - no pairs to validate
             return result
         
-        # Validate each (child, parent) pair
+        # Validate each (child, parent) pair in a single pass
         # In chain order: child → parent (child delegates to parent)
+        # Space consistency issues are reported after all pair issues
+        consistency_issues: List[str] = []
         for i in range(len(chain) - 1):
             child = chain[i]
             parent = chain[i + 1]
             
             self._validate_pair(child, parent, result)
             result.validated_pairs += 1
-        
-        # Check for space consistency
-        self._validate_space_consistency(chain, result)
+
+            issue = self._check_space_consistency(child, parent)
+            if issue:
+                consistency_issues.append(issue)
+
+        if consistency_issues:
+            result.issues.extend(consistency_issues)
+            result.valid = False
         
         return result
     
@@ -212,57 +233,46 @@ class ChainValidator:
             result.valid = False
     
     def _version_satisfies(self, version_str: str, op: str, constraint: str) -> bool:
-         """Check if version satisfies constraint using proper semver.
-         
-         Supports:
-         - Standard semver: 1.0.0, 2.1.3
-         - Pre-releases: 1.0.0-alpha, 1.0.0-beta.2
-         - Build metadata: 1.0.0+build.123
-         """
-         try:
-             v = version.parse(version_str)
-             c = version.parse(constraint)
-             
-             if op == ">=":
-                 return v >= c
-             elif op == "<=":
-                 return v <= c
-             elif op == "==":
-                 return v == c
-             elif op == ">":
-                 return v > c
-             elif op == "<":
-                 return v < c
-             elif op == "!=":
-                 return v != c
-             else:
-                 logger.warning(f"Unknown version operator: {op}")
-                 return True
-         except version.InvalidVersion:
-             logger.warning(f"Invalid version format: {version_str} or {constraint}")
-             return True  # Invalid versions pass (warning logged)
+        """Check if version satisfies constraint using proper semver.
+        
+        Supports:
+        - Standard semver: 1.0.0, 2.1.3
+        - Pre-releases: 1.0.0-alpha, 1.0.0-beta.2
+        - Build metadata: 1.0.0+build.123
+        """
+        try:
+            v = _parse_version(version_str)
+            c = _parse_version(constraint)
+        except version.InvalidVersion:
+            logger.warning(f"Invalid version format: {version_str} or {constraint}")
+            return True  # Invalid versions pass (warning logged)
+
+        compare = _VERSION_OPERATORS.get(op)
+        if compare is None:
+            logger.warning(f"Unknown version operator: {op}")
+            return True
+        return compare(v, c)
     
-    def _validate_space_consistency(
+    def _check_space_consistency(
         self,
-        chain: List[Dict[str, Any]],
-        result: ChainValidationResult,
-    ) -> None:
-        """Validate overall space consistency in the chain.
+        child: Dict[str, Any],
+        parent: Dict[str, Any],
+    ) -> Optional[str]:
+        """Check overall space consistency for one link of the chain.
+        
+        Additional check beyond pair validation: a system tool cannot
+        delegate back to a mutable (project or user) tool.
         
-        Additional checks beyond pair validation.
+        Returns:
+            Issue message, or None if the link is consistent
         """
-        # Check if system tools are in the middle of a mutable chain
-        spaces = [e.get("space") for e in chain]
-        
-        # Find transitions from system back to mutable
-        for i in range(len(spaces) - 1):
-            if spaces[i] == "system" and spaces[i + 1] in ("project", "user"):
-                result.issues.append(
-                    f"Invalid chain: system tool '{chain[i].get('item_id')}' "
-                    f"cannot delegate to mutable {spaces[i + 1]} tool "
-                    f"'{chain[i + 1].get('item_id')}'"
-                )
-                result.valid = False
+        if child.get("space") == "system" and parent.get("space") in ("project", "user"):
+            return (
+                f"Invalid chain: system tool '{child.get('item_id')}' "
+                f"cannot delegate to mutable {parent.get('space')} tool "
+                f"'{parent.get('item_id')}'"
+            )
+        return None
     
     def validate_tool(self, tool: Dict[str, Any]) -> ChainValidationResult:
         """Validate a single tool's metadata.
@@ -12,11 +12,14 @@ Caching:
     - Chain cache: Caches resolved execution chains with hash-based invalidation
     - Metadata cache: Caches tool metadata with hash-based invalidation
     - Automatic invalidation when file content changes (via Lilux hash functions)
+    - File hashes are reused while a file's mtime and size are unchanged
 """
 
 import ast
 import hashlib
 import logging
+import os
+import re
 import shlex
 from dataclasses import dataclass, field
 from pathlib import Path
@@ -29,9 +32,9 @@ from lilux.runtime.env_resolver import EnvResolver
 from rye.executor.chain_validator import ChainValidator, ChainValidationResult
 from rye.executor.lockfile_resolver import LockfileResolver
 from rye.utils.extensions import get_tool_extensions
-from rye.utils.integrity import verify_item, IntegrityError
+from rye.utils.integrity import verify_item, verify_items, IntegrityError
 from rye.utils.metadata_manager import MetadataManager
-from rye.utils.path_utils import BundleInfo
+from rye.utils.path_utils import BundleInfo, stat_is_settled
 from rye.constants import AI_DIR, ItemType
 
 logger = logging.getLogger(__name__)
@@ -39,6 +42,16 @@ logger = logging.getLogger(__name__)
 # Maximum allowed chain depth to prevent infinite loops
 MAX_CHAIN_DEPTH = 10
 
+# Config templating: ${VAR} / ${VAR:-default}, {param}, and a value that is
+# exactly one {param} placeholder
+_ENV_VAR_RE = re.compile(r"\$\{([^}]+)\}")
+_PARAM_RE = re.compile(r"\{([^}]+)\}")
+_SINGLE_PARAM_RE = re.compile(r"^\{(\w+)\}$")
+_TEMPLATE_VAR_RE = re.compile(r"\{(\w+)\}")
+
+# Env values containing any of these are shell-quoted when substituted
+_SHELL_SPECIAL_CHARS = frozenset("$`;|&<>(){}[]\\")
+
 
 @dataclass
 class CacheEntry:
@@ -143,6 +156,9 @@ class PrimitiveExecutor:
         self._metadata_cache: Dict[
             str, CacheEntry
         ] = {}  # path -> CacheEntry(metadata, hash)
+        self._file_hash_cache: Dict[
+            str, Tuple[int, int, str]
+        ] = {}  # path -> (mtime_ns, size, hash)
 
     async def execute(
         self,
@@ -857,12 +873,10 @@ class PrimitiveExecutor:
         # Strip unresolved single-placeholder values from body
         # (optional provider fields like tools that weren't supplied)
         if isinstance(config.get("body"), dict):
-            import re
-
             config["body"] = {
                 k: v
                 for k, v in config["body"].items()
-                if not (isinstance(v, str) and re.match(r"^\{\w+\}$", v.strip()))
+                if not (isinstance(v, str) and _SINGLE_PARAM_RE.match(v.strip()))
             }
 
         return config
@@ -876,48 +890,30 @@ class PrimitiveExecutor:
         1. ${VAR} - environment variable substitution (with shell escaping)
         2. {param} - config value substitution (recursive until stable)
         """
-        import re
 
         def escape_shell_value(value: Any) -> Any:
             """Escape values that will be used in shell commands."""
             if isinstance(value, str):
                 # Only escape if value contains shell-special characters
-                if any(
-                    c in value
-                    for c in [
-                        "$",
-                        "`",
-                        ";",
-                        "|",
-                        "&",
-                        "<",
-                        ">",
-                        "(",
-                        ")",
-                        "{",
-                        "}",
-                        "[",
-                        "]",
-                        "\\",
-                    ]
-                ):
+                if not _SHELL_SPECIAL_CHARS.isdisjoint(value):
                     return shlex.quote(value)
             return value
 
+        def replace_var(match: re.Match[str]) -> str:
+            var_expr = match.group(1)
+            if ":-" in var_expr:
+                var_name, default = var_expr.split(":-", 1)
+                raw_value = env.get(var_name, default)
+            else:
+                raw_value = env.get(var_expr, "")
+            return str(escape_shell_value(raw_value)) if raw_value else ""
+
         def substitute_env(value: Any) -> Any:
             """Substitute ${VAR} with environment values (with escaping)."""
             if isinstance(value, str):
-
-                def replace_var(match: re.Match[str]) -> str:
-                    var_expr = match.group(1)
-                    if ":-" in var_expr:
-                        var_name, default = var_expr.split(":-", 1)
-                        raw_value = env.get(var_name, default)
-                    else:
-                        raw_value = env.get(var_expr, "")
-                    return str(escape_shell_value(raw_value)) if raw_value else ""
-
-                return re.sub(r"\$\{([^}]+)\}", replace_var, value)
+                if "${" not in value:
+                    return value
+                return _ENV_VAR_RE.sub(replace_var, value)
             elif isinstance(value, dict):
                 return {k: substitute_env(v) for k, v in value.items()}
             elif isinstance(value, list):
@@ -931,27 +927,30 @@ class PrimitiveExecutor:
             the original typed value is returned (int, list, dict, etc.).
             When a value contains mixed text like "prefix-{param}", str() is used.
             """
-            if isinstance(value, str):
-                stripped = value.strip()
-                single_match = re.match(r"^\{(\w+)\}$", stripped)
-                if single_match:
-                    param_name = single_match.group(1)
-                    if param_name in params:
-                        return params[param_name]
-                    return value
-
-                def replace_param(match: re.Match[str]) -> str:
-                    param_name = match.group(1)
-                    if param_name in params:
-                        return str(params[param_name])
-                    return match.group(0)
-
-                return re.sub(r"\{([^}]+)\}", replace_param, value)
-            elif isinstance(value, dict):
-                return {k: substitute_params(v, params) for k, v in value.items()}
-            elif isinstance(value, list):
-                return [substitute_params(item, params) for item in value]
-            return value
+            def replace_param(match: re.Match[str]) -> str:
+                param_name = match.group(1)
+                if param_name in params:
+                    return str(params[param_name])
+                return match.group(0)
+
+            def substitute(value: Any) -> Any:
+                if isinstance(value, str):
+                    if "{" not in value:
+                        return value
+                    single_match = _SINGLE_PARAM_RE.match(value.strip())
+                    if single_match:
+                        param_name = single_match.group(1)
+                        if param_name in params:
+                            return params[param_name]
+                        return value
+                    return _PARAM_RE.sub(replace_param, value)
+                elif isinstance(value, dict):
+                    return {k: substitute(v) for k, v in value.items()}
+                elif isinstance(value, list):
+                    return [substitute(item) for item in value]
+                return value
+
+            return substitute(value)
 
         # Pass 1: env var substitution
         result = substitute_env(config)
@@ -1044,13 +1043,12 @@ class PrimitiveExecutor:
 
     def _template_string(self, template: str, ctx: Dict[str, str]) -> str:
         """Substitute {var} placeholders in a template string."""
-        import re
 
         def replace(match):
             key = match.group(1)
             return ctx.get(key, match.group(0))
 
-        return re.sub(r"\{(\w+)\}", replace, template)
+        return _TEMPLATE_VAR_RE.sub(replace, template)
 
     def _verify_tool_dependencies(
         self, chain: List[ChainElement], anchor_path: Path
@@ -1058,7 +1056,7 @@ class PrimitiveExecutor:
         """Verify all files in the tool's dependency scope before execution.
 
         Walks the anchor directory tree, verifying every file matching
-        configured extensions via verify_item(). Runs BEFORE subprocess spawn.
+        configured extensions via verify_items(). Runs BEFORE subprocess spawn.
 
         Raises IntegrityError if any file fails verification.
         """
@@ -1102,6 +1100,7 @@ class PrimitiveExecutor:
 
         base = base.resolve()
 
+        dependencies: List[Path] = []
         for dirpath, dirnames, filenames in _os.walk(base, followlinks=False):
             # Prune excluded directories
             dirnames[:] = [d for d in dirnames if d not in exclude_dirs]
@@ -1122,7 +1121,9 @@ class PrimitiveExecutor:
                         f"Symlink escape: {filepath} resolves to {real}"
                     )
 
-                verify_item(filepath, ItemType.TOOL, project_path=self.project_path)
+                dependencies.append(filepath)
+
+        verify_items(dependencies, ItemType.TOOL, project_path=self.project_path)
 
     def _get_user_space(self) -> Path:
         """Get user space path."""
@@ -1147,12 +1148,30 @@ class PrimitiveExecutor:
     # -------------------------------------------------------------------------
 
     def _compute_file_hash(self, path: Path) -> str:
-        """Compute SHA256 hash of file content."""
+        """Compute SHA256 hash of file content.
+
+        The hash is reused without re-reading the file while its mtime and
+        size are unchanged, so cache checks cost one stat() per file.
+        """
+        path_key = str(path)
+        try:
+            st = os.stat(path)
+        except OSError:
+            self._file_hash_cache.pop(path_key, None)
+            return ""
+
+        cached = self._file_hash_cache.get(path_key)
+        if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            return cached[2]
+
         try:
             content = path.read_bytes()
-            return hashlib.sha256(content).hexdigest()
         except Exception:
             return ""
+        file_hash = hashlib.sha256(content).hexdigest()
+        if stat_is_settled(st):
+            self._file_hash_cache[path_key] = (st.st_mtime_ns, st.st_size, file_hash)
+        return file_hash
 
     def _get_cached_metadata(self, path: Path) -> Optional[Dict[str, Any]]:
         """Get cached metadata if file unchanged."""
@@ -1223,6 +1242,7 @@ class PrimitiveExecutor:
         """Clear all caches."""
         self._chain_cache.clear()
         self._metadata_cache.clear()
+        self._file_hash_cache.clear()
 
     def get_cache_stats(self) -> Dict[str, int]:
         """Get cache statistics."""
@@ -11,6 +11,7 @@ from typing import Any, Dict, Optional
 from rye.utils.resolvers import get_user_space
 from rye.utils.parser_router import ParserRouter
 from rye.utils.path_utils import (
+    find_file_by_stem,
     get_project_type_path,
     get_user_type_path,
     get_system_type_paths,
@@ -54,9 +55,9 @@ class KnowledgeHandler:
     def resolve(self, entry_id: str) -> Optional[Path]:
         """Find knowledge entry by ID."""
         for search_path in self.get_search_paths():
-            for file_path in search_path.rglob(f"{entry_id}.md"):
-                if file_path.is_file():
-                    return file_path
+            file_path = find_file_by_stem(search_path, entry_id, [".md"])
+            if file_path:
+                return file_path
         return None
 
     def parse(self, file_path: Path) -> Dict[str, Any]:
@@ -11,6 +11,7 @@ from typing import Any, Dict, Optional
 from rye.utils.resolvers import get_user_space
 from rye.utils.extensions import get_tool_extensions
 from rye.utils.path_utils import (
+    find_file_by_stem,
     get_project_type_path,
     get_user_type_path,
     get_system_type_paths,
@@ -55,10 +56,9 @@ class ToolHandler:
         extensions = get_tool_extensions(self.project_path)
 
         for search_path in self.get_search_paths():
-            for ext in extensions:
-                for file_path in search_path.rglob(f"{tool_name}{ext}"):
-                    if file_path.is_file():
-                        return file_path
+            file_path = find_file_by_stem(search_path, tool_name, extensions)
+            if file_path:
+                return file_path
         return None
 
     def extract_metadata(self, file_path: Path) -> Dict[str, Any]:
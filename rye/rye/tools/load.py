@@ -1,6 +1,7 @@
 """Load tool - load item content for inspection or copy between locations."""
 
 import logging
+import mmap
 import shutil
 from pathlib import Path
 from typing import Any, Dict, Optional
@@ -12,6 +13,28 @@ from rye.utils.integrity import verify_item
 
 logger = logging.getLogger(__name__)
 
+# Files at or above this size are decoded straight from an mmap
+_MMAP_THRESHOLD = 256 * 1024
+
+
+def _read_item(path: Path) -> str:
+    """Read item content as text.
+
+    Large files are decoded directly from a read-only mmap, skipping the
+    intermediate bytes copy read_text() makes. Newlines are normalized the
+    same way read_text() does.
+    """
+    if path.stat().st_size < _MMAP_THRESHOLD:
+        return path.read_text(encoding="utf-8")
+
+    with open(path, "rb") as f, mmap.mmap(
+        f.fileno(), 0, access=mmap.ACCESS_READ
+    ) as mm:
+        content = str(mm, "utf-8")
+        if mm.find(b"\r") != -1:
+            content = content.replace("\r\n", "\n").replace("\r", "\n")
+    return content
+
 
 class LoadTool:
     """Load item content or copy items between locations."""
@@ -45,7 +68,7 @@ class LoadTool:
                 project_path=Path(project_path) if project_path else None,
             )
 
-            content = source_path.read_text(encoding="utf-8")
+            content = _read_item(source_path)
             metadata = self._extract_metadata(source_path, content)
 
             result = {
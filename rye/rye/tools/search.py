@@ -15,13 +15,19 @@ via AST parsing (same pattern as extensions.py / signature_formats.py).
 """
 
 import ast
+import functools
+import heapq
 import logging
+import operator
+import os
 import re
+from array import array
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
-from fnmatch import fnmatch
+from fnmatch import translate
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, FrozenSet, List, Optional, Set, Tuple
 
 from rye.constants import ItemType
 from rye.utils.path_utils import (
@@ -30,10 +36,26 @@ from rye.utils.path_utils import (
     get_user_type_path,
     get_system_type_paths,
     get_extractor_search_paths,
+    iter_files,
+    stat_is_settled,
 )
-from rye.utils.integrity import verify_item, IntegrityError
+from rye.utils.integrity import verify_items
 from rye.utils.parser_router import ParserRouter
 
+try:
+    from rapidfuzz.distance import Levenshtein as _rf_levenshtein
+
+    RAPIDFUZZ_AVAILABLE = True
+except ImportError:
+    RAPIDFUZZ_AVAILABLE = False
+
+try:
+    import ahocorasick
+
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
 DEFAULT_FIELD_WEIGHTS: Dict[str, float] = {
@@ -48,6 +70,37 @@ _search_fields_cache: Optional[Dict[str, Dict[str, float]]] = None
 _extraction_rules_cache: Optional[Dict[str, Dict[str, Any]]] = None
 _parser_names_cache: Optional[Dict[str, str]] = None
 
+# (path, item_type, search_dir, project_path)
+#     -> (st_mtime_ns, st_size, parsed metadata without trust fields)
+_metadata_cache: Dict[
+    Tuple[str, str, str, Optional[str]], Tuple[int, int, Dict[str, Any]]
+] = {}
+
+# (search_dir, item_type, project_path) -> (signature of indexed files, index)
+_index_cache: Dict[
+    Tuple[str, str, Optional[str]],
+    Tuple[Tuple[Tuple[str, int, int], ...], "InvertedIndex"],
+] = {}
+
+# Files needing a parse before extraction moves onto a thread pool
+_PARALLEL_EXTRACT_MIN_FILES = 8
+# Parsing is mostly file reads; a few threads are enough to overlap them
+_PARALLEL_EXTRACT_MAX_WORKERS = 4
+
+# Fallback extractors (used when no parser is available for a file)
+_DIRECTIVE_NAME_RE = re.compile(r'name="([^"]+)"')
+_DIRECTIVE_VERSION_RE = re.compile(r'version="([^"]+)"')
+_DIRECTIVE_DESC_RE = re.compile(r"<description>(.*?)</description>", re.DOTALL)
+_DIRECTIVE_CATEGORY_RE = re.compile(r"<category>(.*?)</category>")
+_TOOL_VERSION_RE = re.compile(r'__version__\s*=\s*["\']([^"\']+)["\']')
+_TOOL_CATEGORY_RE = re.compile(r'__category__\s*=\s*["\']([^"\']+)["\']')
+_TOOL_DESC_RE = re.compile(r'__description__\s*=\s*["\']([^"\']+)["\']')
+_TOOL_DOCSTRING_RE = re.compile(r'^"""(.*?)"""', re.DOTALL | re.MULTILINE)
+# Lines after an opening "---" line up to a closing "---" line (or EOF)
+_FRONTMATTER_RE = re.compile(
+    r"---[^\n]*\n(.*?)(?:^[^\S\n]*---[^\S\n]*$|\Z)", re.DOTALL | re.MULTILINE
+)
+
 
 def _load_extractor_data(
     project_path: Optional[Path] = None,
@@ -161,6 +214,8 @@ def clear_search_cache():
     _search_fields_cache = None
     _extraction_rules_cache = None
     _parser_names_cache = None
+    _metadata_cache.clear()
+    _index_cache.clear()
 
 
 @dataclass
@@ -198,24 +253,21 @@ class QueryParser:
         return self._parse_or()
 
     def _parse_or(self) -> "QueryNode":
-        left = self._parse_and()
+        children = [self._parse_and()]
         while self._match_keyword("OR"):
-            right = self._parse_and()
-            left = OrNode(left, right)
-        return left
+            children.append(self._parse_and())
+        return OrNode.of(children)
 
     def _parse_and(self) -> "QueryNode":
-        left = self._parse_not()
+        children = [self._parse_not()]
         while True:
             if self._match_keyword("AND"):
-                right = self._parse_not()
-                left = AndNode(left, right)
+                children.append(self._parse_not())
             elif self._peek_not() or self._peek_term():
-                right = self._parse_not()
-                left = AndNode(left, right)
+                children.append(self._parse_not())
             else:
                 break
-        return left
+        return AndNode.of(children)
 
     def _parse_not(self) -> "QueryNode":
         if self._match_keyword("NOT"):
@@ -226,12 +278,7 @@ class QueryParser:
         self._skip_whitespace()
         if self.pos >= len(self.query):
             return False
-        remaining = (
-            self.query[self.pos :].split()[0].upper()
-            if self.query[self.pos :].split()
-            else ""
-        )
-        return remaining == "NOT"
+        return self._peek_word_upper() == "NOT"
 
     def _parse_primary(self) -> "QueryNode":
         self._skip_whitespace()
@@ -281,8 +328,8 @@ class QueryParser:
         self._skip_whitespace()
         if self.pos >= len(self.query):
             return False
-        if self.query[self.pos :].upper().startswith(keyword):
-            after = self.pos + len(keyword)
+        after = self.pos + len(keyword)
+        if self.query[self.pos : after].upper() == keyword:
             if after >= len(self.query) or self.query[after].isspace():
                 self.pos = after
                 return True
@@ -294,31 +341,113 @@ class QueryParser:
             return False
         if self.query[self.pos] in "()":
             return False
-        remaining = (
-            self.query[self.pos :].split()[0].upper()
-            if self.query[self.pos :].split()
-            else ""
-        )
-        return remaining not in ("AND", "OR", "NOT", "")
+        return self._peek_word_upper() not in ("AND", "OR", "NOT", "")
+
+    def _peek_word_upper(self) -> str:
+        """Return the upper-cased run of non-whitespace starting at pos."""
+        query = self.query
+        end = self.pos
+        while end < len(query) and not query[end].isspace():
+            end += 1
+        return query[self.pos : end].upper()
 
     def _skip_whitespace(self):
         while self.pos < len(self.query) and self.query[self.pos].isspace():
             self.pos += 1
 
 
+_WORD_RE = re.compile(r"\w+")
+
+
+@dataclass
+class MatchContext:
+    """Per-text state shared by all nodes while evaluating one query.
+
+    Attributes:
+        text_lower: Lowercased text being matched
+        hits: Literal query terms known to occur in text_lower
+        fuzzy_distance: Max Levenshtein distance for fuzzy terms (0 = off)
+        fuzzy_hits: Fuzzy match result per term, filled in as terms are tried
+    """
+
+    text_lower: str
+    hits: Set[str]
+    fuzzy_distance: int = 0
+    fuzzy_hits: Dict[str, bool] = field(default_factory=dict)
+
+    @functools.cached_property
+    def words(self) -> Tuple[str, ...]:
+        """Word tokens of text_lower, computed on first use."""
+        return tuple(_WORD_RE.findall(self.text_lower))
+
+    @functools.cached_property
+    def unique_words(self) -> FrozenSet[str]:
+        """Distinct word tokens, for per-word work that ignores order."""
+        return frozenset(self.words)
+
+
+class InvertedIndex:
+    """Word-level inverted index over the searchable text of a directory.
+
+    Stored column-wise: doc ids are positions in the item list the index
+    was built from, and ``postings[word]`` holds the ids of the docs
+    containing that word in ascending order. Query nodes use it to narrow
+    the docs worth evaluating; the exact match still runs on each one.
+    """
+
+    def __init__(self, texts_lower: List[str]):
+        self.num_docs = len(texts_lower)
+        postings: Dict[str, array] = {}
+        for doc_id, text in enumerate(texts_lower):
+            for word in set(_WORD_RE.findall(text)):
+                ids = postings.get(word)
+                if ids is None:
+                    postings[word] = array("i", (doc_id,))
+                else:
+                    ids.append(doc_id)
+        self.postings = postings
+
+    def docs_with_word(self, predicate) -> Set[int]:
+        """Ids of docs containing a word for which predicate(word) is true."""
+        docs: Set[int] = set()
+        for word, ids in self.postings.items():
+            if predicate(word):
+                docs.update(ids)
+        return docs
+
+    def docs_containing(self, literal: str) -> Optional[Set[int]]:
+        """Ids of docs whose text contains literal, or None if unknown.
+
+        A literal made only of word characters can only occur inside a
+        single word, so the postings of the words containing it are exact.
+        Anything else has to be checked against the full text.
+        """
+        if not _WORD_RE.fullmatch(literal):
+            return None
+        return self.docs_with_word(lambda word: literal in word)
+
+
 class QueryNode:
     """Base class for query AST nodes."""
 
-    def matches(self, text: str, fuzzy_distance: int = 0) -> bool:
+    def matches(self, ctx: MatchContext) -> bool:
         raise NotImplementedError
 
+    def candidates(self, index: InvertedIndex) -> Optional[Set[int]]:
+        """Ids of docs that may match, or None if every doc may match."""
+        return None
+
     def get_terms(self) -> List[str]:
         """Collect raw search terms from the AST (for proximity search)."""
         return []
 
+    def collect_terms(self) -> List[str]:
+        """Collect literal substrings tested by Term and Phrase nodes."""
+        return []
+
 
 class MatchAllNode(QueryNode):
-    def matches(self, text: str, fuzzy_distance: int = 0) -> bool:
+    def matches(self, ctx: MatchContext) -> bool:
         return True
 
     def get_terms(self) -> List[str]:
@@ -329,113 +458,289 @@ class TermNode(QueryNode):
     def __init__(self, term: str):
         self.term = term.lower()
 
-    def matches(self, text: str, fuzzy_distance: int = 0) -> bool:
-        text_lower = text.lower()
-        if self.term in text_lower:
+    def matches(self, ctx: MatchContext) -> bool:
+        if self.term in ctx.hits:
             return True
-        if fuzzy_distance > 0:
-            return self._fuzzy_match(text_lower, fuzzy_distance)
+        if ctx.fuzzy_distance > 0:
+            # A term repeated in the query is only fuzzy-matched once per text
+            hit = ctx.fuzzy_hits.get(self.term)
+            if hit is None:
+                hit = self._fuzzy_match(ctx.unique_words, ctx.fuzzy_distance)
+                ctx.fuzzy_hits[self.term] = hit
+            return hit
         return False
 
-    def _fuzzy_match(self, text: str, max_distance: int) -> bool:
-        words = re.findall(r"\w+", text)
+    def _fuzzy_match(self, words: FrozenSet[str], max_distance: int) -> bool:
+        term_len = len(self.term)
         for word in words:
-            if levenshtein_distance(self.term, word) <= max_distance:
+            # The length gap is a lower bound on the edit distance
+            if abs(len(word) - term_len) > max_distance:
+                continue
+            if levenshtein_distance(self.term, word, max_distance) <= max_distance:
                 return True
         return False
 
+    def candidates(self, index: InvertedIndex) -> Optional[Set[int]]:
+        return index.docs_containing(self.term)
+
     def get_terms(self) -> List[str]:
         return [self.term]
 
+    def collect_terms(self) -> List[str]:
+        return [self.term]
+
 
 class PhraseNode(QueryNode):
     def __init__(self, phrase: str):
         self.phrase = phrase.lower()
 
-    def matches(self, text: str, fuzzy_distance: int = 0) -> bool:
-        return self.phrase in text.lower()
+    def matches(self, ctx: MatchContext) -> bool:
+        return self.phrase in ctx.hits
+
+    def candidates(self, index: InvertedIndex) -> Optional[Set[int]]:
+        # Every word of the phrase must occur somewhere in a matching doc
+        docs: Optional[Set[int]] = None
+        for word in _WORD_RE.findall(self.phrase):
+            word_docs = index.docs_containing(word)
+            docs = word_docs if docs is None else docs & word_docs
+        return docs
 
     def get_terms(self) -> List[str]:
         return self.phrase.split()
 
+    def collect_terms(self) -> List[str]:
+        return [self.phrase]
+
 
 class WildcardNode(QueryNode):
     def __init__(self, pattern: str):
         self.pattern = pattern.lower()
+        # Translate the glob once instead of per word via fnmatch()
+        self._match = re.compile(translate(self.pattern)).match
 
-    def matches(self, text: str, fuzzy_distance: int = 0) -> bool:
-        words = re.findall(r"\w+", text.lower())
-        for word in words:
-            if fnmatch(word, self.pattern):
+    def matches(self, ctx: MatchContext) -> bool:
+        for word in ctx.words:
+            if self._match(word):
                 return True
         return False
 
+    def candidates(self, index: InvertedIndex) -> Optional[Set[int]]:
+        return index.docs_with_word(self._match)
+
     def get_terms(self) -> List[str]:
         return [self.pattern.replace("*", "")]
 
 
-class AndNode(QueryNode):
-    def __init__(self, left: QueryNode, right: QueryNode):
-        self.left = left
-        self.right = right
+def _eval_cost(node: QueryNode) -> Tuple[int, int]:
+    """Sort key putting cheap, selective nodes first in And/Or evaluation.
 
-    def matches(self, text: str, fuzzy_distance: int = 0) -> bool:
-        return self.left.matches(text, fuzzy_distance) and self.right.matches(
-            text, fuzzy_distance
-        )
+    Term and Phrase nodes are hit-set lookups (longer literals are rarer),
+    nested nodes cost roughly their children, and wildcards scan every word.
+    """
+    if isinstance(node, (TermNode, PhraseNode)):
+        literal = node.term if isinstance(node, TermNode) else node.phrase
+        return (1, -len(literal))
+    if isinstance(node, WildcardNode):
+        return (3, 0)
+    if isinstance(node, MatchAllNode):
+        return (0, 0)
+    return (2, 0)
 
-    def get_terms(self) -> List[str]:
-        return self.left.get_terms() + self.right.get_terms()
 
+class _BooleanNode(QueryNode):
+    """N-ary And/Or node over a flattened chain of children.
 
-class OrNode(QueryNode):
-    def __init__(self, left: QueryNode, right: QueryNode):
-        self.left = left
-        self.right = right
+    children keeps query order (proximity search depends on term order);
+    matching walks _eval_order, the same children cheapest first.
+    """
 
-    def matches(self, text: str, fuzzy_distance: int = 0) -> bool:
-        return self.left.matches(text, fuzzy_distance) or self.right.matches(
-            text, fuzzy_distance
-        )
+    def __init__(self, children: List[QueryNode]):
+        self.children = tuple(children)
+        self._eval_order = tuple(sorted(self.children, key=_eval_cost))
+
+    @classmethod
+    def of(cls, children: List[QueryNode]) -> QueryNode:
+        """Build a node from children, merging nested nodes of the same kind."""
+        if len(children) == 1:
+            return children[0]
+        flat: List[QueryNode] = []
+        for child in children:
+            if type(child) is cls:
+                flat.extend(child.children)
+            else:
+                flat.append(child)
+        return cls(flat)
 
     def get_terms(self) -> List[str]:
-        return self.left.get_terms() + self.right.get_terms()
+        return [t for child in self.children for t in child.get_terms()]
+
+    def collect_terms(self) -> List[str]:
+        return [t for child in self.children for t in child.collect_terms()]
+
+
+class AndNode(_BooleanNode):
+    def matches(self, ctx: MatchContext) -> bool:
+        for child in self._eval_order:
+            if not child.matches(ctx):
+                return False
+        return True
+
+    def candidates(self, index: InvertedIndex) -> Optional[Set[int]]:
+        docs: Optional[Set[int]] = None
+        for child in self._eval_order:
+            child_docs = child.candidates(index)
+            if child_docs is not None:
+                docs = child_docs if docs is None else docs & child_docs
+        return docs
+
+
+class OrNode(_BooleanNode):
+    def matches(self, ctx: MatchContext) -> bool:
+        for child in self._eval_order:
+            if child.matches(ctx):
+                return True
+        return False
+
+    def candidates(self, index: InvertedIndex) -> Optional[Set[int]]:
+        docs: Set[int] = set()
+        for child in self._eval_order:
+            child_docs = child.candidates(index)
+            if child_docs is None:
+                return None
+            docs |= child_docs
+        return docs
 
 
 class NotNode(QueryNode):
     def __init__(self, child: QueryNode):
         self.child = child
 
-    def matches(self, text: str, fuzzy_distance: int = 0) -> bool:
-        return not self.child.matches(text, fuzzy_distance)
+    def matches(self, ctx: MatchContext) -> bool:
+        return not self.child.matches(ctx)
 
     def get_terms(self) -> List[str]:
         return []
 
+    def collect_terms(self) -> List[str]:
+        return self.child.collect_terms()
+
+
+class CompiledQuery:
+    """A parsed query plus a one-pass scanner for its literal terms.
+
+    Every Term/Phrase literal in the AST is looked up in a single scan of
+    the lowercased text (an Aho-Corasick automaton when pyahocorasick is
+    installed), and the AST is then evaluated against the resulting hit
+    set instead of re-scanning the text once per node.
+    """
+
+    def __init__(self, root: QueryNode):
+        self.root = root
+        terms = dict.fromkeys(root.collect_terms())
+        # "" is a substring of everything and cannot go in the automaton
+        self._always: Set[str] = {""} if "" in terms else set()
+        self._terms = tuple(t for t in terms if t)
+
+        self._automaton = None
+        if AHOCORASICK_AVAILABLE and len(self._terms) > 1:
+            self._automaton = ahocorasick.Automaton()
+            for term in self._terms:
+                self._automaton.add_word(term, term)
+            self._automaton.make_automaton()
+
+    def scan(self, text_lower: str) -> Set[str]:
+        """Return the literal terms that occur in text_lower."""
+        hits = set(self._always)
+        if self._automaton is not None:
+            hits.update(term for _end, term in self._automaton.iter(text_lower))
+        else:
+            hits.update(term for term in self._terms if term in text_lower)
+        return hits
+
+    def matches(self, text: str, fuzzy_distance: int = 0) -> bool:
+        text_lower = text.lower()
+        ctx = MatchContext(text_lower, self.scan(text_lower), fuzzy_distance)
+        return self.root.matches(ctx)
+
+    def candidates(
+        self, index: InvertedIndex, fuzzy_distance: int = 0
+    ) -> Optional[Set[int]]:
+        """Ids of indexed docs that may match, or None for all of them."""
+        if fuzzy_distance > 0:
+            # Fuzzy terms match words the index has no posting for
+            return None
+        return self.root.candidates(index)
+
+    def get_terms(self) -> List[str]:
+        return self.root.get_terms()
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_query(query: str) -> CompiledQuery:
+    """Parse and compile a query string, reusing it for repeated queries.
+
+    Query nodes are never mutated after parsing, so cached queries are safe
+    to share between searches.
+    """
+    return CompiledQuery(QueryParser(query).parse())
+
 
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
 
 
-def levenshtein_distance(s1: str, s2: str) -> int:
-    """Calculate Levenshtein distance between two strings."""
+def levenshtein_distance(
+    s1: str, s2: str, max_distance: Optional[int] = None
+) -> int:
+    """Calculate Levenshtein distance between two strings.
+
+    Uses rapidfuzz's C implementation when installed. With max_distance set,
+    any distance above it may be reported as max_distance + 1, which lets
+    either implementation stop early.
+    """
+    if RAPIDFUZZ_AVAILABLE:
+        return _rf_levenshtein.distance(s1, s2, score_cutoff=max_distance)
+    return _levenshtein_distance_py(s1, s2, max_distance)
+
+
+def _levenshtein_distance_py(
+    s1: str, s2: str, max_distance: Optional[int] = None
+) -> int:
+    """Pure-Python Levenshtein distance (fallback when rapidfuzz is absent).
+
+    Two preallocated rows are swapped each iteration instead of building a
+    new row per character. With max_distance set, returns max_distance + 1
+    as soon as the length gap or a whole row exceeds it.
+    """
     if len(s1) < len(s2):
-        return levenshtein_distance(s2, s1)
-    if len(s2) == 0:
+        s1, s2 = s2, s1
+    n = len(s2)
+    if n == 0:
         return len(s1)
+    if max_distance is not None and len(s1) - n > max_distance:
+        return max_distance + 1
 
-    prev_row = list(range(len(s2) + 1))
+    prev_row = list(range(n + 1))
+    curr_row = [0] * (n + 1)
     for i, c1 in enumerate(s1):
-        curr_row = [i + 1]
+        curr_row[0] = row_min = i + 1
         for j, c2 in enumerate(s2):
-            insertions = prev_row[j + 1] + 1
-            deletions = curr_row[j] + 1
-            substitutions = prev_row[j] + (c1 != c2)
-            curr_row.append(min(insertions, deletions, substitutions))
-        prev_row = curr_row
-
-    return prev_row[-1]
+            cost = prev_row[j] + (c1 != c2)
+            insertion = prev_row[j + 1] + 1
+            if insertion < cost:
+                cost = insertion
+            deletion = curr_row[j] + 1
+            if deletion < cost:
+                cost = deletion
+            curr_row[j + 1] = cost
+            if cost < row_min:
+                row_min = cost
+        if max_distance is not None and row_min > max_distance:
+            return max_distance + 1
+        prev_row, curr_row = curr_row, prev_row
+
+    return prev_row[n]
 
 
 def proximity_match(text: str, terms: List[str], max_distance: int) -> bool:
@@ -443,7 +748,7 @@ def proximity_match(text: str, terms: List[str], max_distance: int) -> bool:
     if len(terms) < 2:
         return True
 
-    words = re.findall(r"\w+", text.lower())
+    words = _WORD_RE.findall(text.lower())
     term_positions: Dict[str, List[int]] = {}
 
     for term in terms:
@@ -469,99 +774,157 @@ def proximity_match(text: str, terms: List[str], max_distance: int) -> bool:
 # ---------------------------------------------------------------------------
 
 
+def _parse_filter_date(value: str) -> datetime:
+    return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
+@functools.lru_cache(maxsize=1024)
+def _version_parts(value: str) -> Optional[Tuple[int, ...]]:
+    """Split a dotted version into ints padded to three parts, or None."""
+    try:
+        parts = [int(x) for x in value.split(".")]
+    except ValueError:
+        return None
+    while len(parts) < 3:
+        parts.append(0)
+    return tuple(parts)
+
+
+_VERSION_OPS = (
+    (">=", operator.ge),
+    ("<=", operator.le),
+    (">", operator.gt),
+    ("<", operator.lt),
+)
+
+
 class FilterMatcher:
-    """Match items against meta-field filters."""
+    """Match items against meta-field filters.
+
+    Filters are normalized once per search by prepare() into
+    (field, op, operand) tuples, so the per-item checks don't re-parse
+    dates and versions or re-lowercase the filter values.
+    """
 
     @staticmethod
     def matches(item: Dict[str, Any], filters: Dict[str, Any]) -> bool:
+        return FilterMatcher.matches_prepared(item, FilterMatcher.prepare(filters))
+
+    @staticmethod
+    def prepare(filters: Dict[str, Any]) -> List[Tuple[str, str, Any]]:
+        prepared: List[Tuple[str, str, Any]] = []
         for fld, filter_value in filters.items():
-            if not FilterMatcher._match_filter(item, fld, filter_value):
+            if fld in ("date_from", "date_to"):
+                try:
+                    filter_date = _parse_filter_date(filter_value)
+                except (ValueError, TypeError, AttributeError):
+                    filter_date = None
+                prepared.append((fld, fld, filter_date))
+            elif isinstance(filter_value, list):
+                try:
+                    value_set: Optional[FrozenSet[Any]] = frozenset(filter_value)
+                except TypeError:
+                    value_set = None
+                prepared.append((fld, "in", (filter_value, value_set)))
+            elif isinstance(filter_value, str):
+                prepared.append((fld, *FilterMatcher._prepare_str(filter_value)))
+            else:
+                prepared.append((fld, "eq", filter_value))
+        return prepared
+
+    @staticmethod
+    def _prepare_str(filter_value: str) -> Tuple[str, Any]:
+        if filter_value.startswith("!"):
+            return "ne", filter_value[1:]
+        for prefix, op in _VERSION_OPS:
+            if filter_value.startswith(prefix):
+                return "version", (op, _version_parts(filter_value[len(prefix) :]))
+        return "str_eq", (filter_value, filter_value.lower())
+
+    @staticmethod
+    def matches_prepared(
+        item: Dict[str, Any], filters: List[Tuple[str, str, Any]]
+    ) -> bool:
+        for fld, op, operand in filters:
+            if not FilterMatcher._match_filter(item, fld, op, operand):
                 return False
         return True
 
     @staticmethod
-    def _match_filter(item: Dict[str, Any], fld: str, filter_value: Any) -> bool:
-        if fld == "date_from":
-            return FilterMatcher._match_date_from(item, filter_value)
-        if fld == "date_to":
-            return FilterMatcher._match_date_to(item, filter_value)
+    def _match_filter(item: Dict[str, Any], fld: str, op: str, operand: Any) -> bool:
+        if op == "date_from":
+            return FilterMatcher._match_date(item, operand, operator.ge)
+        if op == "date_to":
+            return FilterMatcher._match_date(item, operand, operator.le)
 
         item_value = item.get(fld) or item.get("metadata", {}).get(fld)
         if item_value is None:
             return False
 
-        if isinstance(filter_value, list):
+        if op == "in":
+            filter_list, filter_set = operand
             if isinstance(item_value, list):
-                return bool(set(filter_value) & set(item_value))
-            return item_value in filter_value
-
-        if isinstance(filter_value, str):
-            if filter_value.startswith("!"):
-                target = filter_value[1:]
-                if isinstance(item_value, list):
-                    return target not in item_value
-                return str(item_value) != target
-            if filter_value.startswith(">="):
-                return FilterMatcher._compare_version(item_value, filter_value[2:]) >= 0
-            if filter_value.startswith("<="):
-                return FilterMatcher._compare_version(item_value, filter_value[2:]) <= 0
-            if filter_value.startswith(">"):
-                return FilterMatcher._compare_version(item_value, filter_value[1:]) > 0
-            if filter_value.startswith("<"):
-                return FilterMatcher._compare_version(item_value, filter_value[1:]) < 0
+                if filter_set is None:
+                    return bool(set(filter_list) & set(item_value))
+                return not filter_set.isdisjoint(item_value)
+            return item_value in filter_list
+
+        if op == "ne":
+            if isinstance(item_value, list):
+                return operand not in item_value
+            return str(item_value) != operand
+
+        if op == "version":
+            compare, filter_parts = operand
+            return compare(
+                FilterMatcher._compare_parts(
+                    _version_parts(str(item_value)), filter_parts
+                ),
+                0,
+            )
+
+        if op == "str_eq":
+            filter_value, filter_lower = operand
             if isinstance(item_value, list):
                 return filter_value in item_value
-            return str(item_value).lower() == filter_value.lower()
+            return str(item_value).lower() == filter_lower
 
-        return item_value == filter_value
+        return item_value == operand
 
     @staticmethod
-    def _match_date_from(item: Dict[str, Any], date_str: str) -> bool:
+    def _match_date(
+        item: Dict[str, Any], filter_date: Optional[datetime], compare
+    ) -> bool:
         item_date = item.get("created_at") or item.get("metadata", {}).get(
             "created_at"
         )
-        if not item_date:
+        if not item_date or filter_date is None:
             return True
         try:
-            filter_date = datetime.fromisoformat(date_str.replace("Z", "+00:00"))
             if isinstance(item_date, str):
-                item_date = datetime.fromisoformat(item_date.replace("Z", "+00:00"))
-            return item_date >= filter_date
+                item_date = _parse_filter_date(item_date)
+            return compare(item_date, filter_date)
         except (ValueError, TypeError):
             return True
 
     @staticmethod
-    def _match_date_to(item: Dict[str, Any], date_str: str) -> bool:
-        item_date = item.get("created_at") or item.get("metadata", {}).get(
-            "created_at"
-        )
-        if not item_date:
-            return True
-        try:
-            filter_date = datetime.fromisoformat(date_str.replace("Z", "+00:00"))
-            if isinstance(item_date, str):
-                item_date = datetime.fromisoformat(item_date.replace("Z", "+00:00"))
-            return item_date <= filter_date
-        except (ValueError, TypeError):
-            return True
+    def _compare_parts(
+        parts1: Optional[Tuple[int, ...]], parts2: Optional[Tuple[int, ...]]
+    ) -> int:
+        if parts1 is None or parts2 is None:
+            return 0
+        for p1, p2 in zip(parts1, parts2):
+            if p1 < p2:
+                return -1
+            if p1 > p2:
+                return 1
+        return 0
 
     @staticmethod
     def _compare_version(v1: str, v2: str) -> int:
-        try:
-            parts1 = [int(x) for x in str(v1).split(".")]
-            parts2 = [int(x) for x in str(v2).split(".")]
-            while len(parts1) < 3:
-                parts1.append(0)
-            while len(parts2) < 3:
-                parts2.append(0)
-            for p1, p2 in zip(parts1, parts2):
-                if p1 < p2:
-                    return -1
-                if p1 > p2:
-                    return 1
-            return 0
-        except (ValueError, AttributeError):
-            return 0
+        return FilterMatcher._compare_parts(
+            _version_parts(str(v1)), _version_parts(str(v2))
+        )
 
 
 # ---------------------------------------------------------------------------
@@ -580,10 +943,106 @@ class MetadataExtractor:
         self._parser_router = ParserRouter(project_path)
 
     def extract(
-        self, file_path: Path, item_type: str, search_dir: Path
+        self,
+        file_path: Path,
+        item_type: str,
+        search_dir: Path,
+        st: Optional[os.stat_result] = None,
     ) -> Optional[Dict[str, Any]]:
         """Extract metadata from a single file.
 
+        Parsed fields are cached per file and reused while its mtime and
+        size are unchanged, so repeat searches only stat() unchanged files.
+        The signed/integrity fields are re-derived on every call, so trust
+        store changes take effect immediately. Callers get a copy they are
+        free to annotate (score, type). Pass ``st`` when the caller has
+        already stat()ed the file.
+        """
+        if st is None:
+            try:
+                st = file_path.stat()
+            except OSError as e:
+                logger.debug(f"Cannot stat {file_path}: {e}")
+                return None
+
+        return self.extract_many([(file_path, st)], item_type, search_dir)[0]
+
+    def extract_many(
+        self,
+        files: List[Tuple[Path, os.stat_result]],
+        item_type: str,
+        search_dir: Path,
+    ) -> List[Optional[Dict[str, Any]]]:
+        """Extract metadata from (path, stat) pairs, in the same order.
+
+        Cached entries are reused as in extract(). When enough files need
+        parsing they are read and parsed on a small thread pool, since that
+        work is mostly file I/O.
+        """
+        project_key = str(self.project_path) if self.project_path else None
+        results: List[Optional[Dict[str, Any]]] = [None] * len(files)
+        misses: List[int] = []
+        for i, (file_path, st) in enumerate(files):
+            key = (str(file_path), item_type, str(search_dir), project_key)
+            cached = _metadata_cache.get(key)
+            if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+                results[i] = cached[2]
+            else:
+                misses.append(i)
+
+        def _parse(i: int) -> Optional[Dict[str, Any]]:
+            return self._extract_uncached(files[i][0], item_type, search_dir)
+
+        if len(misses) >= _PARALLEL_EXTRACT_MIN_FILES:
+            # Load the extractor data and parser once up front, so worker
+            # threads never race to fill those caches
+            get_extraction_rules(item_type, self.project_path)
+            parser_name = get_parser_name(item_type, self.project_path)
+            if parser_name:
+                self._parser_router.preload(parser_name)
+            with ThreadPoolExecutor(
+                max_workers=_PARALLEL_EXTRACT_MAX_WORKERS
+            ) as pool:
+                parsed = list(pool.map(_parse, misses))
+        else:
+            parsed = [_parse(i) for i in misses]
+
+        for i, metadata in zip(misses, parsed):
+            if metadata is not None:
+                file_path, st = files[i]
+                # A file written moments ago could be rewritten unnoticed
+                if stat_is_settled(st):
+                    key = (str(file_path), item_type, str(search_dir), project_key)
+                    _metadata_cache[key] = (st.st_mtime_ns, st.st_size, metadata)
+                results[i] = metadata
+
+        hashes = verify_items(
+            [files[i][0] for i, metadata in enumerate(results) if metadata],
+            item_type,
+            project_path=self.project_path,
+            strict=False,
+        )
+        extracted: List[Optional[Dict[str, Any]]] = []
+        for (file_path, _st), metadata in zip(files, results):
+            if metadata is None:
+                extracted.append(None)
+                continue
+            integrity_hash = hashes[file_path]
+            extracted.append(
+                {
+                    **metadata,
+                    "metadata": dict(metadata["metadata"]),
+                    "signed": integrity_hash is not None,
+                    "integrity": integrity_hash,
+                }
+            )
+        return extracted
+
+    def _extract_uncached(
+        self, file_path: Path, item_type: str, search_dir: Path
+    ) -> Optional[Dict[str, Any]]:
+        """Read and parse a single file.
+
         Uses the data-driven EXTRACTION_RULES and PARSER from the extractor
         for the given item_type. Falls back to regex-based extraction if the
         parser is unavailable.
@@ -633,17 +1092,6 @@ class MetadataExtractor:
             elif item_type == ItemType.KNOWLEDGE:
                 metadata.update(self._extract_knowledge_meta(content))
 
-        try:
-            integrity_hash = verify_item(file_path, item_type)
-            metadata["signed"] = True
-            metadata["integrity"] = integrity_hash
-        except IntegrityError:
-            metadata["signed"] = False
-            metadata["integrity"] = None
-        except Exception:
-            metadata["signed"] = False
-            metadata["integrity"] = None
-
         return metadata
 
     def _detect_source(self, file_path: Path) -> str:
@@ -703,23 +1151,21 @@ class MetadataExtractor:
         result: Dict[str, Any] = {"title": "", "description": "", "metadata": {}}
 
         if 'name="' in content:
-            match = re.search(r'name="([^"]+)"', content)
+            match = _DIRECTIVE_NAME_RE.search(content)
             if match:
                 result["title"] = match.group(1)
                 result["name"] = match.group(1)
 
         if 'version="' in content:
-            match = re.search(r'version="([^"]+)"', content)
+            match = _DIRECTIVE_VERSION_RE.search(content)
             if match:
                 result["metadata"]["version"] = match.group(1)
 
-        desc_match = re.search(
-            r"<description>(.*?)</description>", content, re.DOTALL
-        )
+        desc_match = _DIRECTIVE_DESC_RE.search(content)
         if desc_match:
             result["description"] = desc_match.group(1).strip()
 
-        category_match = re.search(r"<category>(.*?)</category>", content)
+        category_match = _DIRECTIVE_CATEGORY_RE.search(content)
         if category_match:
             result["category"] = category_match.group(1).strip()
             result["metadata"]["category"] = category_match.group(1).strip()
@@ -731,26 +1177,22 @@ class MetadataExtractor:
         result: Dict[str, Any] = {"metadata": {}}
 
         if "__version__" in content:
-            match = re.search(r'__version__\s*=\s*["\']([^"\']+)["\']', content)
+            match = _TOOL_VERSION_RE.search(content)
             if match:
                 result["metadata"]["version"] = match.group(1)
 
         if "__category__" in content:
-            match = re.search(r'__category__\s*=\s*["\']([^"\']+)["\']', content)
+            match = _TOOL_CATEGORY_RE.search(content)
             if match:
                 result["category"] = match.group(1)
                 result["metadata"]["category"] = match.group(1)
 
         if "__description__" in content:
-            match = re.search(
-                r'__description__\s*=\s*["\']([^"\']+)["\']', content
-            )
+            match = _TOOL_DESC_RE.search(content)
             if match:
                 result["description"] = match.group(1)
 
-        docstring_match = re.search(
-            r'^"""(.*?)"""', content, re.DOTALL | re.MULTILINE
-        )
+        docstring_match = _TOOL_DOCSTRING_RE.search(content)
         if docstring_match and not result.get("description"):
             lines = docstring_match.group(1).strip().split("\n")
             result["description"] = lines[0] if lines else ""
@@ -761,11 +1203,9 @@ class MetadataExtractor:
     def _extract_knowledge_meta(content: str) -> Dict[str, Any]:
         result: Dict[str, Any] = {"title": "", "description": "", "metadata": {}}
 
-        if content.startswith("---"):
-            lines = content.split("\n")
-            for line in lines[1:]:
-                if line.strip() == "---":
-                    break
+        frontmatter = _FRONTMATTER_RE.match(content)
+        if frontmatter:
+            for line in frontmatter.group(1).split("\n"):
                 if ":" in line:
                     key, value = line.split(":", 1)
                     key = key.strip()
@@ -830,7 +1270,11 @@ class SearchTool:
         )
 
         try:
-            query_ast = QueryParser(opts.query).parse()
+            query = _parse_query(opts.query)
+            field_queries = {
+                field_name: _parse_query(field_query)
+                for field_name, field_query in opts.fields.items()
+            }
             search_paths = self._resolve_search_paths(opts)
             field_weights = get_search_fields(
                 opts.item_type, Path(opts.project_path) if opts.project_path else None
@@ -840,10 +1284,13 @@ class SearchTool:
                 Path(opts.project_path) if opts.project_path else None
             )
             results = self._search_items(
-                search_paths, opts, query_ast, field_weights, extractor
+                search_paths, opts, query, field_queries, field_weights, extractor
             )
-            results = self._sort_results(results, opts.sort_by)
             total = len(results)
+            top = None
+            if opts.offset >= 0 and opts.limit >= 0:
+                top = opts.offset + opts.limit
+            results = self._sort_results(results, opts.sort_by, top)
             results = results[opts.offset : opts.offset + opts.limit]
 
             return {
@@ -896,7 +1343,8 @@ class SearchTool:
         self,
         search_paths: List[Tuple[Path, str]],
         opts: SearchOptions,
-        query_ast: QueryNode,
+        query: CompiledQuery,
+        field_queries: Dict[str, CompiledQuery],
         field_weights: Dict[str, float],
         extractor: MetadataExtractor,
     ) -> List[Dict[str, Any]]:
@@ -906,21 +1354,58 @@ class SearchTool:
         )
         prox_enabled = opts.proximity.get("enabled", False)
         prox_distance = opts.proximity.get("max_distance", 5)
+        filters = FilterMatcher.prepare(opts.filters)
 
         for search_dir, _source_label in search_paths:
-            for file_path in search_dir.rglob("*"):
-                if not file_path.is_file() or file_path.name.startswith("_"):
+            files: List[Tuple[Path, os.stat_result]] = []
+            for entry in iter_files(search_dir):
+                if entry.name.startswith("_"):
+                    continue
+                try:
+                    files.append((Path(entry.path), entry.stat()))
+                except OSError:
                     continue
 
-                item = extractor.extract(file_path, opts.item_type, search_dir)
-                if not item:
+            items: List[Dict[str, Any]] = []
+            signature: Optional[List[Tuple[str, int, int]]] = []
+            extracted = extractor.extract_many(files, opts.item_type, search_dir)
+            for (file_path, st), item in zip(files, extracted):
+                if item:
+                    items.append(item)
+                    if signature is not None:
+                        if stat_is_settled(st):
+                            signature.append(
+                                (str(file_path), st.st_mtime_ns, st.st_size)
+                            )
+                        else:
+                            # A same-tick rewrite would not change the signature
+                            signature = None
+
+            index = self._get_index(
+                search_dir,
+                opts.item_type,
+                items,
+                tuple(signature) if signature is not None else None,
+                extractor.project_path,
+            )
+            candidates = query.candidates(index, fuzzy_distance)
+            for doc_id in (
+                range(len(items)) if candidates is None else sorted(candidates)
+            ):
+                item = items[doc_id]
+                if filters and not FilterMatcher.matches_prepared(
+                    item, filters
+                ):
                     continue
 
-                if not self._matches_query(item, query_ast, opts, fuzzy_distance):
+                score = self._evaluate(
+                    item, opts, query, field_queries, field_weights, fuzzy_distance
+                )
+                if score is None:
                     continue
 
                 if prox_enabled:
-                    terms = query_ast.get_terms()
+                    terms = query.get_terms()
                     if terms and len(terms) >= 2:
                         searchable = self._get_searchable_text(
                             item, field_weights
@@ -928,45 +1413,101 @@ class SearchTool:
                         if not proximity_match(searchable, terms, prox_distance):
                             continue
 
-                if opts.filters and not FilterMatcher.matches(
-                    item, opts.filters
-                ):
-                    continue
-
-                score = self._score_item(
-                    item, opts, field_weights, fuzzy_distance
-                )
                 item["score"] = round(score, 4)
                 item["type"] = opts.item_type
                 results.append(item)
 
         return results
 
+    def _get_index(
+        self,
+        search_dir: Path,
+        item_type: str,
+        items: List[Dict[str, Any]],
+        signature: Optional[Tuple[Tuple[str, int, int], ...]],
+        project_path: Optional[Path] = None,
+    ) -> InvertedIndex:
+        """Return the inverted index for items, rebuilding it on any change.
+
+        The signature lists (path, mtime_ns, size) of every indexed file, so
+        an added, removed or modified file invalidates the cached index.
+        A signature of None (some file changed too recently to trust its
+        stat) builds a fresh index without caching it.
+        """
+        key = (
+            str(search_dir),
+            item_type,
+            str(project_path) if project_path else None,
+        )
+        cached = _index_cache.get(key)
+        if signature is not None and cached and cached[0] == signature:
+            return cached[1]
+
+        index = InvertedIndex(
+            [
+                self._get_searchable_text(item, DEFAULT_FIELD_WEIGHTS).lower()
+                for item in items
+            ]
+        )
+        if signature is not None:
+            _index_cache[key] = (signature, index)
+        return index
+
     # ------------------------------------------------------------------
-    # Query matching
+    # Query matching and BM25-inspired scoring
     # ------------------------------------------------------------------
 
-    def _matches_query(
+    def _evaluate(
         self,
         item: Dict[str, Any],
-        query_ast: QueryNode,
         opts: SearchOptions,
+        query: CompiledQuery,
+        field_queries: Dict[str, CompiledQuery],
+        field_weights: Dict[str, float],
         fuzzy_distance: int,
-    ) -> bool:
+    ) -> Optional[float]:
+        """Match an item against the query and score it in one pass.
+
+        Returns None if the item doesn't match. Field-specific query
+        results are computed once and reused for the score.
+        """
         searchable_text = self._get_searchable_text(item, DEFAULT_FIELD_WEIGHTS)
-        if not query_ast.matches(searchable_text, fuzzy_distance):
-            return False
+        if not query.matches(searchable_text, fuzzy_distance):
+            return None
 
-        for field_name, field_query in opts.fields.items():
-            field_value = str(item.get(field_name, ""))
-            if field_name == "content":
-                field_value = item.get("preview", "")
+        field_values: Dict[str, str] = {}
 
-            field_ast = QueryParser(field_query).parse()
-            if not field_ast.matches(field_value, fuzzy_distance):
-                return False
+        def _field_value(field_name: str) -> str:
+            value = field_values.get(field_name)
+            if value is None:
+                if field_name == "content":
+                    value = item.get("preview", "")
+                else:
+                    value = str(item.get(field_name, ""))
+                field_values[field_name] = value
+            return value
 
-        return True
+        for field_name, field_query in field_queries.items():
+            if not field_query.matches(_field_value(field_name), fuzzy_distance):
+                return None
+
+        if not opts.query and not opts.fields:
+            return 1.0
+
+        total_score = 0.0
+        max_score = sum(field_weights.values())
+
+        for field_name, weight in field_weights.items():
+            if query.matches(_field_value(field_name), fuzzy_distance):
+                total_score += weight
+
+        # Every field query matched above, so each adds its full weight
+        for field_name in field_queries:
+            weight = field_weights.get(field_name, 1.0)
+            total_score += weight
+            max_score += weight
+
+        return min(1.0, total_score / max_score) if max_score > 0 else 0.0
 
     @staticmethod
     def _get_searchable_text(
@@ -982,54 +1523,28 @@ class SearchTool:
                 parts.append(str(val))
         return " ".join(parts)
 
-    # ------------------------------------------------------------------
-    # BM25-inspired scoring
-    # ------------------------------------------------------------------
-
-    def _score_item(
-        self,
-        item: Dict[str, Any],
-        opts: SearchOptions,
-        field_weights: Dict[str, float],
-        fuzzy_distance: int,
-    ) -> float:
-        if not opts.query and not opts.fields:
-            return 1.0
-
-        query_ast = (
-            QueryParser(opts.query).parse() if opts.query else MatchAllNode()
-        )
-        total_score = 0.0
-        max_score = sum(field_weights.values())
-
-        for field_name, weight in field_weights.items():
-            field_value = str(item.get(field_name, ""))
-            if field_name == "content":
-                field_value = item.get("preview", "")
-
-            if query_ast.matches(field_value, fuzzy_distance):
-                total_score += weight
-
-        for field_name, field_query in opts.fields.items():
-            field_value = str(item.get(field_name, ""))
-            if field_name == "content":
-                field_value = item.get("preview", "")
-            field_ast = QueryParser(field_query).parse()
-            weight = field_weights.get(field_name, 1.0)
-            if field_ast.matches(field_value, fuzzy_distance):
-                total_score += weight
-                max_score += weight
-
-        return min(1.0, total_score / max_score) if max_score > 0 else 0.0
-
     # ------------------------------------------------------------------
     # Sorting with tie-breaking
     # ------------------------------------------------------------------
 
     @staticmethod
     def _sort_results(
-        results: List[Dict[str, Any]], sort_by: str
+        results: List[Dict[str, Any]], sort_by: str, top: Optional[int] = None
     ) -> List[Dict[str, Any]]:
+        """Sort results, or only select the first ``top`` of them.
+
+        With ``top`` set, a bounded heap selection returns the same items in
+        the same order as the full sort truncated to ``top``, without
+        sorting every match when only one page is returned.
+        """
+        if top is not None and top < len(results):
+            def _sorted(items, key, reverse=False):
+                if reverse:
+                    return heapq.nlargest(top, items, key=key)
+                return heapq.nsmallest(top, items, key=key)
+        else:
+            _sorted = sorted
+
         source_order = {"project": 0, "user": 1, "system": 2}
 
         def _tie_key(item: Dict[str, Any]) -> Tuple:
@@ -1039,7 +1554,7 @@ class SearchTool:
             )
 
         if sort_by == "score":
-            return sorted(
+            return _sorted(
                 results,
                 key=lambda x: (-x.get("score", 0), *_tie_key(x)),
             )
@@ -1052,13 +1567,13 @@ class SearchTool:
                     or ""
                 )
 
-            return sorted(
+            return _sorted(
                 results,
                 key=lambda x: (-len(_date_key(x)), _date_key(x)),
                 reverse=True,
             )
         elif sort_by == "name":
-            return sorted(
+            return _sorted(
                 results,
                 key=lambda x: (x.get("name", "").lower(), *_tie_key(x)),
             )
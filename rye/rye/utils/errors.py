@@ -46,7 +46,7 @@ class ErrorCode(Enum):
     UNKNOWN_ERROR = "UNKNOWN_ERROR"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ErrorResponse:
     """Standardized error response format.
 
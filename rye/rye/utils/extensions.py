@@ -11,6 +11,7 @@ import logging
 from pathlib import Path
 from typing import List, Optional
 
+from rye.utils.extractor_loader import load_python_extractor
 from rye.utils.path_utils import get_extractor_search_paths
 
 logger = logging.getLogger(__name__)
@@ -73,20 +74,14 @@ def _extract_extensions_from_file(file_path: Path) -> List[str]:
             return []
 
     try:
-        content = file_path.read_text()
-        tree = ast.parse(content)
-
-        for node in tree.body:
-            if isinstance(node, ast.Assign) and len(node.targets) == 1:
-                target = node.targets[0]
-                if isinstance(target, ast.Name) and target.id == "EXTENSIONS":
-                    if isinstance(node.value, ast.List):
-                        return [
-                            elt.value
-                            for elt in node.value.elts
-                            if isinstance(elt, ast.Constant)
-                            and isinstance(elt.value, str)
-                        ]
+        module = load_python_extractor(file_path)
+        for value in module.assignments("EXTENSIONS"):
+            if isinstance(value, ast.List):
+                return [
+                    elt.value
+                    for elt in value.elts
+                    if isinstance(elt, ast.Constant) and isinstance(elt.value, str)
+                ]
         return []
     except Exception as e:
         logger.warning(f"Failed to extract extensions from {file_path}: {e}")
@@ -0,0 +1,409 @@
+"""
+Shared loading of extractor tool files.
+
+Signature formats, validation schemas and extraction rules are all read
+from the same extractor files. load_extractor_metadata() walks the
+extractor directories once and fills all three registries from that
+walk; signature_formats.py and validators.py only cache and query them.
+
+Results extracted from a file are cached by (path, mtime, size) so that
+clearing a registry cache, as tests do between cases, only re-reads
+extractors that actually changed. Callers get their own copy of cached
+dicts and lists. Python extractors are read once and
+parsed at most once, and only if the constant being looked up appears
+in the source at all. Larger extractor sets are loaded on a small
+thread pool and merged afterwards in precedence order.
+"""
+
+import ast
+import copy
+import functools
+import logging
+import os
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar
+
+from rye.utils.path_utils import (
+    get_extractor_search_paths,
+    iter_files,
+    stat_is_settled,
+)
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+DEFAULT_SIGNATURE_FORMAT: Dict[str, Any] = {"prefix": "#", "after_shebang": True}
+
+# Below this many extractor files, a thread pool costs more than it saves
+_PARALLEL_LOAD_MIN_FILES = 8
+
+_file_cache_lock = threading.Lock()
+# (path, kind) -> (st_mtime_ns, st_size, extracted value)
+_file_cache: Dict[Tuple[str, str], Tuple[int, int, Any]] = {}
+
+
+def _detach(value: T) -> T:
+    """Copy mutable containers so callers never share the cached object."""
+    if isinstance(value, (dict, list)):
+        return copy.deepcopy(value)
+    return value
+
+
+def load_cached(file_path: Path, kind: str, extract: Callable[[Path], T]) -> T:
+    """Return extract(file_path), reusing the result while the file is unchanged.
+
+    Args:
+        file_path: Extractor file to read
+        kind: Name of what extract() pulls out (e.g. "signature_format"),
+            so different extractions of one file are cached separately
+        extract: Function reading the value from the file
+
+    Returns:
+        The (possibly cached) result of extract(file_path). Dicts and
+        lists are returned as fresh copies; other values (such as
+        PythonExtractor) are shared and must be treated as read-only.
+    """
+    try:
+        st = os.stat(file_path)
+    except OSError:
+        return extract(file_path)
+
+    key = (str(file_path), kind)
+    with _file_cache_lock:
+        cached = _file_cache.get(key)
+    if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        return _detach(cached[2])
+
+    value = extract(file_path)
+    # A file written within the mtime granularity could change again
+    # without its stat changing, so only cache settled files
+    if stat_is_settled(st):
+        with _file_cache_lock:
+            _file_cache[key] = (st.st_mtime_ns, st.st_size, value)
+        return _detach(value)
+    return value
+
+
+def clear_extractor_file_cache():
+    """Forget all per-file extraction results."""
+    with _file_cache_lock:
+        _file_cache.clear()
+
+
+class PythonExtractor:
+    """Source of a Python extractor file, parsed on first use.
+
+    Only top-level ``NAME = value`` assignments are indexed, since that is
+    how extractors declare EXTENSIONS, SIGNATURE_FORMAT, VALIDATION_SCHEMA
+    and EXTRACTION_RULES.
+    """
+
+    def __init__(self, content: str):
+        self.content = content
+
+    @functools.cached_property
+    def _parsed(
+        self,
+    ) -> Tuple[Optional[Dict[str, List[ast.expr]]], Optional[Exception]]:
+        try:
+            tree = ast.parse(self.content)
+        except Exception as e:
+            return None, e
+
+        assignments: Dict[str, List[ast.expr]] = {}
+        for node in tree.body:
+            if isinstance(node, ast.Assign) and len(node.targets) == 1:
+                target = node.targets[0]
+                if isinstance(target, ast.Name):
+                    assignments.setdefault(target.id, []).append(node.value)
+        return assignments, None
+
+    def assignments(self, name: str) -> List[ast.expr]:
+        """Values assigned to name at module level, in source order.
+
+        Skips parsing entirely when name does not occur in the source.
+        Raises the parse error (e.g. SyntaxError) if the file does not parse.
+        """
+        if name not in self.content:
+            return []
+        assignments, error = self._parsed
+        if error is not None:
+            raise error
+        return assignments.get(name, [])
+
+
+def _read_python_extractor(file_path: Path) -> PythonExtractor:
+    return PythonExtractor(file_path.read_text())
+
+
+def load_python_extractor(file_path: Path) -> PythonExtractor:
+    """Return the (cached) PythonExtractor for file_path.
+
+    Raises OSError/UnicodeDecodeError if the file cannot be read.
+    """
+    return load_cached(file_path, "python", _read_python_extractor)
+
+
+def _read_yaml_extractor(file_path: Path) -> Any:
+    import yaml
+
+    return yaml.safe_load(file_path.read_text())
+
+
+def load_yaml_extractor(file_path: Path) -> Any:
+    """Return the (cached) parsed content of a YAML extractor file.
+
+    Raises the read or YAML error if the file cannot be loaded.
+    """
+    return load_cached(file_path, "yaml", _read_yaml_extractor)
+
+
+@dataclass
+class ExtractorMetadata:
+    """Registries built from one walk over the extractor directories.
+
+    Attributes:
+        signature_formats: File extension -> signature format
+        validation_schemas: Item type -> VALIDATION_SCHEMA
+        extraction_rules: Item type -> EXTRACTION_RULES
+    """
+
+    signature_formats: Dict[str, Dict[str, Any]]
+    validation_schemas: Dict[str, Dict[str, Any]]
+    extraction_rules: Dict[str, Dict[str, Any]]
+
+
+_metadata_lock = threading.RLock()
+_metadata_cache: Dict[Optional[str], ExtractorMetadata] = {}
+
+
+def load_extractor_metadata(project_path: Optional[Path] = None) -> ExtractorMetadata:
+    """Return the extractor registries for project_path, loading them once."""
+    key = str(project_path) if project_path else None
+    with _metadata_lock:
+        metadata = _metadata_cache.get(key)
+        if metadata is None:
+            metadata = _load_extractor_metadata(project_path)
+            _metadata_cache[key] = metadata
+        return metadata
+
+
+def clear_extractor_cache():
+    """Drop the loaded registries so the next lookup walks the extractors again."""
+    with _metadata_lock:
+        _metadata_cache.clear()
+
+
+def _list_extractor_files(extractors_dir: Path) -> List[Path]:
+    """All *_extractor.yaml files, then all *_extractor.py files, recursively.
+
+    Same files and order as rglob() for each suffix, from a single walk.
+    """
+    yaml_files: List[Path] = []
+    py_files: List[Path] = []
+    for entry in iter_files(extractors_dir):
+        if entry.name.endswith("_extractor.yaml"):
+            yaml_files.append(Path(entry.path))
+        elif entry.name.endswith("_extractor.py"):
+            py_files.append(Path(entry.path))
+    return yaml_files + py_files
+
+
+def _load_extractor_file(
+    file_path: Path, top_level: bool
+) -> Tuple[Optional[Dict[str, Any]], Optional[Dict[str, Any]], Optional[Dict[str, Any]]]:
+    """Extract (signature format data, validation schema, rules) from one file."""
+    # Signature formats only come from top-level extractor files
+    extractor_data = None
+    if top_level:
+        extractor_data = load_cached(
+            file_path, "signature_format", _extract_format_from_file
+        )
+    schema = load_cached(file_path, "validation_schema", _extract_schema_from_file)
+    rules = load_cached(file_path, "extraction_rules", _extract_rules_from_file)
+    return extractor_data, schema, rules
+
+
+def _load_extractor_metadata(project_path: Optional[Path]) -> ExtractorMetadata:
+    # (file, is top-level) in precedence order: project > user > system
+    candidates: List[Tuple[Path, bool]] = []
+    for extractors_dir in get_extractor_search_paths(project_path):
+        if not extractors_dir.exists():
+            continue
+        for file_path in _list_extractor_files(extractors_dir):
+            if not file_path.name.startswith("_"):
+                candidates.append((file_path, file_path.parent == extractors_dir))
+
+    if len(candidates) >= _PARALLEL_LOAD_MIN_FILES:
+        with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1)) as pool:
+            loaded = list(pool.map(lambda c: _load_extractor_file(*c), candidates))
+    else:
+        loaded = [_load_extractor_file(*c) for c in candidates]
+
+    formats: Dict[str, Dict[str, Any]] = {}
+    schemas: Dict[str, Dict[str, Any]] = {}
+    rules: Dict[str, Dict[str, Any]] = {}
+
+    # Merge in precedence order: the first value seen wins
+    for (file_path, _), (extractor_data, schema, extraction_rules) in zip(
+        candidates, loaded
+    ):
+        if extractor_data:
+            sig_format = extractor_data.get("signature_format", DEFAULT_SIGNATURE_FORMAT)
+            for ext in extractor_data.get("extensions", []):
+                if ext.lower() not in formats:
+                    formats[ext.lower()] = sig_format
+
+        # Extract item type from filename (e.g., directive_extractor.yaml -> directive)
+        item_type = file_path.stem.replace("_extractor", "")
+
+        if schema and item_type not in schemas:
+            schemas[item_type] = schema
+        if extraction_rules and item_type not in rules:
+            rules[item_type] = extraction_rules
+
+    return ExtractorMetadata(formats, schemas, rules)
+
+
+def _extract_format_from_file(file_path: Path) -> Optional[Dict[str, Any]]:
+    """Extract EXTENSIONS and SIGNATURE_FORMAT from an extractor file."""
+    if file_path.suffix in (".yaml", ".yml"):
+        try:
+            data = load_yaml_extractor(file_path)
+            if not data:
+                return None
+            result = {
+                "extensions": data.get("extensions", []),
+                "signature_format": data.get("signature_format"),
+            }
+            return result if result["extensions"] else None
+        except Exception as e:
+            logger.warning(f"Failed to load YAML format from {file_path}: {e}")
+            return None
+
+    try:
+        module = load_python_extractor(file_path)
+        if "EXTENSIONS" not in module.content:
+            return None
+
+        result = {"extensions": [], "signature_format": None}
+
+        for value in module.assignments("EXTENSIONS"):
+            if isinstance(value, ast.List):
+                result["extensions"] = [
+                    elt.value
+                    for elt in value.elts
+                    if isinstance(elt, ast.Constant) and isinstance(elt.value, str)
+                ]
+        for value in module.assignments("SIGNATURE_FORMAT"):
+            if isinstance(value, ast.Dict):
+                result["signature_format"] = ast.literal_eval(value)
+
+        return result if result["extensions"] else None
+    except Exception as e:
+        logger.warning(f"Failed to extract format from {file_path}: {e}")
+        return None
+
+
+def _extract_schema_from_file(file_path: Path) -> Optional[Dict[str, Any]]:
+    """Extract VALIDATION_SCHEMA from an extractor file."""
+    if file_path.suffix in (".yaml", ".yml"):
+        try:
+            data = load_yaml_extractor(file_path)
+            return data.get("validation_schema") if data else None
+        except Exception as e:
+            logger.warning(f"Failed to load YAML schema from {file_path}: {e}")
+            return None
+
+    module = load_python_extractor(file_path)
+
+    # Try AST parsing first
+    try:
+        for value in module.assignments("VALIDATION_SCHEMA"):
+            if isinstance(value, ast.Dict):
+                return ast.literal_eval(value)
+        return None
+    except SyntaxError as e:
+        logger.warning(f"Syntax error in {file_path}, using regex fallback: {e}")
+        return _extract_schema_regex(module.content)
+    except Exception as e:
+        logger.warning(f"Failed to extract schema from {file_path}: {e}")
+        return _extract_schema_regex(module.content)
+
+
+def _extract_schema_regex(content: str) -> Optional[Dict[str, Any]]:
+    """Fallback regex-based schema extraction for malformed files."""
+    # Look for VALIDATION_SCHEMA = {...}
+    # Match simple dict patterns with optional nesting
+    match = re.search(r"VALIDATION_SCHEMA\s*=\s*\{", content)
+    if match:
+        try:
+            # Extract from the match position to end of content
+            start = match.end() - 1  # Include opening brace
+            # Try to find matching closing brace with basic nesting
+            brace_count = 0
+            for i, char in enumerate(content[start:]):
+                if char == "{":
+                    brace_count += 1
+                elif char == "}":
+                    brace_count -= 1
+                    if brace_count == 0:
+                        schema_str = content[start : start + i + 1]
+                        return ast.literal_eval(schema_str)
+        except Exception:
+            pass
+    return None
+
+
+def _extract_rules_from_file(file_path: Path) -> Optional[Dict[str, Any]]:
+    """Extract EXTRACTION_RULES from an extractor file."""
+    if file_path.suffix in (".yaml", ".yml"):
+        try:
+            data = load_yaml_extractor(file_path)
+            return data.get("extraction_rules") if data else None
+        except Exception as e:
+            logger.warning(f"Failed to load YAML rules from {file_path}: {e}")
+            return None
+
+    module = load_python_extractor(file_path)
+
+    # Try AST parsing first
+    try:
+        for value in module.assignments("EXTRACTION_RULES"):
+            if isinstance(value, ast.Dict):
+                return ast.literal_eval(value)
+        return None
+    except SyntaxError as e:
+        logger.warning(f"Syntax error in {file_path}, using regex fallback: {e}")
+        return _extract_rules_regex(module.content)
+    except Exception as e:
+        logger.warning(f"Failed to extract rules from {file_path}: {e}")
+        return _extract_rules_regex(module.content)
+
+
+def _extract_rules_regex(content: str) -> Optional[Dict[str, Any]]:
+    """Fallback regex-based rules extraction for malformed files."""
+    # Look for EXTRACTION_RULES = {...}
+    match = re.search(r"EXTRACTION_RULES\s*=\s*\{", content)
+    if match:
+        try:
+            # Extract from the match position to end of content
+            start = match.end() - 1  # Include opening brace
+            # Try to find matching closing brace with basic nesting
+            brace_count = 0
+            for i, char in enumerate(content[start:]):
+                if char == "{":
+                    brace_count += 1
+                elif char == "}":
+                    brace_count -= 1
+                    if brace_count == 0:
+                        rules_str = content[start : start + i + 1]
+                        return ast.literal_eval(rules_str)
+        except Exception:
+            pass
+    return None
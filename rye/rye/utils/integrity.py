@@ -5,11 +5,14 @@ Replaces the dead-code IntegrityVerifier with MetadataManager-based verification
 """
 
 import logging
+import os
+import threading
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Dict, Iterable, Optional, Tuple
 
 from rye.constants import ItemType
 from rye.utils.metadata_manager import MetadataManager
+from rye.utils.path_utils import stat_is_settled
 
 logger = logging.getLogger(__name__)
 
@@ -19,11 +22,26 @@ class IntegrityError(Exception):
     pass
 
 
+_verified_lock = threading.Lock()
+# (realpath, st_ino, st_mtime_ns, st_ctime_ns, st_size, item_type, project_path)
+#     -> (verified hash, signing key fingerprint, signing key PEM)
+_verified_cache: Dict[
+    Tuple[str, int, int, int, int, str, Optional[str]], Tuple[str, str, bytes]
+] = {}
+
+
+def clear_verified_cache():
+    """Forget all cached verification results."""
+    with _verified_lock:
+        _verified_cache.clear()
+
+
 def verify_item(
     file_path: Path,
     item_type: str,
     *,
     project_path: Optional[Path] = None,
+    content: Optional[str] = None,
 ) -> str:
     """Verify signature matches content. Returns verified hash.
 
@@ -35,16 +53,131 @@ def verify_item(
 
     Raises IntegrityError if unsigned, tampered, or untrusted.
 
+    When the file is read here (content not given), a successful result is
+    cached by (realpath, inode, mtime, ctime, size), so re-verifying an
+    unchanged file skips reading, hashing and the Ed25519 check. ctime is
+    part of the key because, unlike mtime, it cannot be restored after a
+    rewrite. The signing key is still looked up in the trust store every
+    time, so removing a key takes effect immediately.
+
     Args:
         file_path: Path to the item file
         item_type: One of ItemType.DIRECTIVE, ItemType.TOOL, ItemType.KNOWLEDGE
         project_path: Optional project path for tool signature format resolution
+        content: File content if the caller has already read it (UTF-8)
 
     Returns:
         Verified content hash (SHA256 hex digest)
     """
+    from rye.utils.trust_store import TrustStore
+
+    get_key = TrustStore().get_key
+    if content is None:
+        return _verify_file(file_path, item_type, project_path, get_key)
+    return _verify_content(file_path, item_type, content, project_path, get_key)[0]
+
+
+def verify_items(
+    file_paths: Iterable[Path],
+    item_type: str,
+    *,
+    project_path: Optional[Path] = None,
+    strict: bool = True,
+) -> Dict[Path, Optional[str]]:
+    """Verify several items of one type. Returns verified hash per path.
+
+    Performs the same checks as verify_item(), but looks up each signing
+    key in the trust store only once for the whole batch, so verifying a
+    directory of files signed by the same key reads that key once.
+
+    Raises IntegrityError for the first file that fails verification,
+    unless strict is False, in which case failing files map to None.
+
+    Args:
+        file_paths: Paths to the item files
+        item_type: One of ItemType.DIRECTIVE, ItemType.TOOL, ItemType.KNOWLEDGE
+        project_path: Optional project path for tool signature format resolution
+        strict: Raise on the first failure instead of recording None
+
+    Returns:
+        Dict mapping each path to its verified content hash (or None)
+    """
+    from rye.utils.trust_store import TrustStore
+
+    trust_store = TrustStore()
+    keys: Dict[str, Optional[bytes]] = {}
+
+    def get_key(fingerprint: str) -> Optional[bytes]:
+        if fingerprint not in keys:
+            keys[fingerprint] = trust_store.get_key(fingerprint)
+        return keys[fingerprint]
+
+    verified: Dict[Path, Optional[str]] = {}
+    for file_path in file_paths:
+        try:
+            verified[file_path] = _verify_file(
+                file_path, item_type, project_path, get_key
+            )
+        except Exception:
+            if strict:
+                raise
+            verified[file_path] = None
+    return verified
+
+
+def _verify_file(
+    file_path: Path,
+    item_type: str,
+    project_path: Optional[Path],
+    get_key: Callable[[str], Optional[bytes]],
+) -> str:
+    """Read and verify file_path, reusing the result while it is unchanged."""
+    real_path = os.path.realpath(file_path)
+    try:
+        st = os.stat(real_path)
+    except OSError:
+        st = None
+
+    key = None
+    if st is not None:
+        key = (
+            real_path,
+            st.st_ino,
+            st.st_mtime_ns,
+            st.st_ctime_ns,
+            st.st_size,
+            item_type,
+            str(project_path) if project_path else None,
+        )
+        with _verified_lock:
+            cached = _verified_cache.get(key)
+        # Only trust the cached result if its signing key is still trusted
+        if cached and get_key(cached[1]) == cached[2]:
+            return cached[0]
+
+    # Stat before reading: if the file changes in between, the entry is
+    # stored under the old stat key and is never hit again
     content = file_path.read_text(encoding="utf-8")
+    result = _verify_content(file_path, item_type, content, project_path, get_key)
+    # A file written moments ago could be rewritten with the same mtime and size
+    if key is not None and stat_is_settled(st):
+        with _verified_lock:
+            _verified_cache[key] = result
+    return result[0]
+
+
+def _verify_content(
+    file_path: Path,
+    item_type: str,
+    content: str,
+    project_path: Optional[Path],
+    get_key: Callable[[str], Optional[bytes]],
+) -> Tuple[str, str, bytes]:
+    """Run the verify_item() checks on already-read content.
 
+    Returns:
+        (verified hash, signing key fingerprint, signing key PEM)
+    """
     sig_info = MetadataManager.get_signature_info(
         item_type, content, file_path=file_path, project_path=project_path
     )
@@ -71,10 +204,8 @@ def verify_item(
     pubkey_fp = sig_info["pubkey_fp"]
 
     from lilux.primitives.signing import verify_signature
-    from rye.utils.trust_store import TrustStore
 
-    trust_store = TrustStore()
-    public_key_pem = trust_store.get_key(pubkey_fp)
+    public_key_pem = get_key(pubkey_fp)
 
     if public_key_pem is None:
         raise IntegrityError(
@@ -87,4 +218,4 @@ def verify_item(
             f"Ed25519 signature verification failed: {file_path}"
         )
 
-    return actual
+    return actual, pubkey_fp, public_key_pem
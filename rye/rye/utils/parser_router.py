@@ -76,6 +76,14 @@ class ParserRouter:
         logger.warning(f"Parser not found: {parser_name}")
         return None
 
+    def preload(self, parser_name: str) -> bool:
+        """Load a parser ahead of use, e.g. before parsing from worker threads.
+
+        Returns:
+            True if the parser was found and loaded
+        """
+        return self._load_parser(parser_name) is not None
+
     def parse(self, parser_name: str, content: str) -> Dict[str, Any]:
         """
         Parse content using the specified parser.
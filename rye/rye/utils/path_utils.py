@@ -11,9 +11,10 @@ Provides functions to:
 import importlib.metadata
 import logging
 import os
+import time
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple, Union
 
 from rye.constants import AI_DIR, ItemType
 
@@ -21,6 +22,10 @@ logger = logging.getLogger(__name__)
 
 _system_spaces_cache: Optional[List["BundleInfo"]] = None
 
+# Filesystem timestamps can be coarse (a few ms on Linux, 2s on FAT), so a
+# file rewritten within the same tick can keep its mtime
+_RACY_MTIME_WINDOW_NS = 2_000_000_000
+
 
 @dataclass(frozen=True)
 class BundleInfo:
@@ -95,6 +100,94 @@ def ensure_parent_directory(file_path: Path) -> Path:
     return ensure_directory(file_path.parent)
 
 
+def iter_files(root: Path) -> Iterator[os.DirEntry]:
+    """Walk a directory tree with os.scandir, yielding file entries.
+
+    DirEntry caches the d_type from the directory read, so directories
+    and files are told apart without a stat() per entry. Symlinked
+    directories are not followed. Unreadable directories are skipped.
+    Entries come in the same order as Path.rglob("*"): a directory's own
+    files first, then its subdirectories depth-first.
+
+    Args:
+        root: Directory to walk
+
+    Yields:
+        os.DirEntry for each regular file under root
+    """
+    stack = [str(root)]
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except OSError:
+            continue
+        subdirs = []
+        with it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.path)
+                elif entry.is_file():
+                    yield entry
+        stack.extend(reversed(subdirs))
+
+
+def stat_is_settled(st: os.stat_result) -> bool:
+    """Check whether a file's stat reliably identifies its content.
+
+    A file modified in the last couple of seconds may be rewritten again
+    with the same size and, on filesystems with coarse timestamps, the
+    same mtime and ctime. Caches keyed by stat fields should not store
+    entries for such files; once both timestamps are older than that, any
+    later write changes them.
+
+    Args:
+        st: Result of os.stat() taken before reading the file
+
+    Returns:
+        True if the stat can be used as a cache key
+    """
+    newest = max(st.st_mtime_ns, st.st_ctime_ns)
+    return time.time_ns() - newest >= _RACY_MTIME_WINDOW_NS
+
+
+def find_file_by_stem(
+    root: Path, stem: str, extensions: Sequence[str]
+) -> Optional[Path]:
+    """Find a file named {stem}{ext} anywhere under root.
+
+    Extensions are tried in priority order: a match on the first extension
+    returns immediately, otherwise the best-ranked match is returned once
+    the walk completes. A stem containing "/" must match the trailing
+    directories of the file path, like rglob("a/b.md") would.
+
+    Args:
+        root: Directory to search
+        stem: File name without extension, optionally with leading dirs
+        extensions: Allowed extensions in priority order (e.g. [".py", ".yaml"])
+
+    Returns:
+        Path to the matching file, or None
+    """
+    parent_suffix, _, base = stem.rpartition("/")
+    ranks = {f"{base}{ext}": rank for rank, ext in enumerate(extensions)}
+    if parent_suffix:
+        parent_suffix = os.sep + parent_suffix.replace("/", os.sep)
+
+    best: Optional[Tuple[int, str]] = None
+    for entry in iter_files(root):
+        rank = ranks.get(entry.name)
+        if rank is None:
+            continue
+        if parent_suffix and not os.path.dirname(entry.path).endswith(parent_suffix):
+            continue
+        if rank == 0:
+            return Path(entry.path)
+        if best is None or rank < best[0]:
+            best = (rank, entry.path)
+
+    return Path(best[1]) if best else None
+
+
 def get_user_space() -> Path:
     """Get user space base directory from env var or default to home directory.
 
@@ -26,6 +26,19 @@ from rye.constants import ItemType
 logger = logging.getLogger(__name__)
 
 
+def _type_dirs(project_path: Path, item_type: str) -> List[Tuple[Path, str]]:
+    """Item type directories in precedence order, whether or not they exist.
+
+    resolve() probes candidate files in these directly: a file under a
+    missing directory is simply not found, so no exists() check is needed.
+    """
+    return [
+        (get_project_type_path(project_path, item_type), "project"),
+        (get_user_type_path(item_type), "user"),
+        (get_system_type_path(item_type), "system"),
+    ]
+
+
 class DirectiveResolver:
     """Resolve directive file paths across 3-tier space."""
 
@@ -33,27 +46,11 @@ class DirectiveResolver:
         self.project_path = project_path or Path.cwd()
         self.user_space = get_user_space()
         self.system_space = get_system_space()
+        self._type_dirs = _type_dirs(self.project_path, ItemType.DIRECTIVE)
 
     def get_search_paths(self) -> List[Tuple[Path, str]]:
         """Get search paths in precedence order with space labels."""
-        paths = []
-
-        # Project space (highest priority)
-        project_dir = get_project_type_path(self.project_path, ItemType.DIRECTIVE)
-        if project_dir.exists():
-            paths.append((project_dir, "project"))
-
-        # User space
-        user_dir = get_user_type_path(ItemType.DIRECTIVE)
-        if user_dir.exists():
-            paths.append((user_dir, "user"))
-
-        # System space (lowest priority)
-        system_dir = get_system_type_path(ItemType.DIRECTIVE)
-        if system_dir.exists():
-            paths.append((system_dir, "system"))
-
-        return paths
+        return [(d, space) for d, space in self._type_dirs if d.exists()]
 
     def resolve(self, directive_id: str) -> Optional[Path]:
         """Find directive file by relative path ID in project > user > system order.
@@ -62,7 +59,7 @@ class DirectiveResolver:
             directive_id: Relative path from .ai/directives/ without extension.
                          e.g., "core/build" -> .ai/directives/core/build.md
         """
-        for search_dir, _ in self.get_search_paths():
+        for search_dir, _ in self._type_dirs:
             file_path = search_dir / f"{directive_id}.md"
             if file_path.is_file():
                 return file_path
@@ -70,7 +67,7 @@ class DirectiveResolver:
 
     def resolve_with_space(self, directive_id: str) -> Optional[Tuple[Path, str]]:
         """Find directive by relative path ID and return (path, space) tuple."""
-        for search_dir, space in self.get_search_paths():
+        for search_dir, space in self._type_dirs:
             file_path = search_dir / f"{directive_id}.md"
             if file_path.is_file():
                 return (file_path, space)
@@ -84,27 +81,19 @@ class ToolResolver:
         self.project_path = project_path or Path.cwd()
         self.user_space = get_user_space()
         self.system_space = get_system_space()
+        self._type_dirs = _type_dirs(self.project_path, ItemType.TOOL)
+        self._extensions: Optional[Tuple[str, ...]] = None
+
+    @property
+    def extensions(self) -> Tuple[str, ...]:
+        """Tool file extensions, looked up once per resolver."""
+        if self._extensions is None:
+            self._extensions = tuple(get_tool_extensions(self.project_path))
+        return self._extensions
 
     def get_search_paths(self) -> List[Tuple[Path, str]]:
         """Get search paths in precedence order with space labels."""
-        paths = []
-
-        # Project space (highest priority)
-        project_dir = get_project_type_path(self.project_path, ItemType.TOOL)
-        if project_dir.exists():
-            paths.append((project_dir, "project"))
-
-        # User space
-        user_dir = get_user_type_path(ItemType.TOOL)
-        if user_dir.exists():
-            paths.append((user_dir, "user"))
-
-        # System space (lowest priority)
-        system_dir = get_system_type_path(ItemType.TOOL)
-        if system_dir.exists():
-            paths.append((system_dir, "system"))
-
-        return paths
+        return [(d, space) for d, space in self._type_dirs if d.exists()]
 
     def resolve(self, tool_id: str) -> Optional[Path]:
         """Find tool file by relative path ID in project > user > system order.
@@ -113,9 +102,9 @@ class ToolResolver:
             tool_id: Relative path from .ai/tools/ without extension.
                     e.g., "rye/core/registry/registry" -> .ai/tools/rye/core/registry/registry.py
         """
-        extensions = get_tool_extensions(self.project_path)
+        extensions = self.extensions
 
-        for search_dir, _ in self.get_search_paths():
+        for search_dir, _ in self._type_dirs:
             for ext in extensions:
                 file_path = search_dir / f"{tool_id}{ext}"
                 if file_path.is_file():
@@ -124,9 +113,9 @@ class ToolResolver:
 
     def resolve_with_space(self, tool_id: str) -> Optional[Tuple[Path, str]]:
         """Find tool by relative path ID and return (path, space) tuple."""
-        extensions = get_tool_extensions(self.project_path)
+        extensions = self.extensions
 
-        for search_dir, space in self.get_search_paths():
+        for search_dir, space in self._type_dirs:
             for ext in extensions:
                 file_path = search_dir / f"{tool_id}{ext}"
                 if file_path.is_file():
@@ -141,27 +130,11 @@ class KnowledgeResolver:
         self.project_path = project_path or Path.cwd()
         self.user_space = get_user_space()
         self.system_space = get_system_space()
+        self._type_dirs = _type_dirs(self.project_path, ItemType.KNOWLEDGE)
 
     def get_search_paths(self) -> List[Tuple[Path, str]]:
         """Get search paths in precedence order with space labels."""
-        paths = []
-
-        # Project space (highest priority)
-        project_dir = get_project_type_path(self.project_path, ItemType.KNOWLEDGE)
-        if project_dir.exists():
-            paths.append((project_dir, "project"))
-
-        # User space
-        user_dir = get_user_type_path(ItemType.KNOWLEDGE)
-        if user_dir.exists():
-            paths.append((user_dir, "user"))
-
-        # System space (lowest priority)
-        system_dir = get_system_type_path(ItemType.KNOWLEDGE)
-        if system_dir.exists():
-            paths.append((system_dir, "system"))
-
-        return paths
+        return [(d, space) for d, space in self._type_dirs if d.exists()]
 
     def resolve(self, entry_id: str) -> Optional[Path]:
         """Find knowledge entry by relative path ID in project > user > system order.
@@ -170,7 +143,7 @@ class KnowledgeResolver:
             entry_id: Relative path from .ai/knowledge/ without extension.
                      e.g., "patterns/singleton" -> .ai/knowledge/patterns/singleton.md
         """
-        for search_dir, _ in self.get_search_paths():
+        for search_dir, _ in self._type_dirs:
             file_path = search_dir / f"{entry_id}.md"
             if file_path.is_file():
                 return file_path
@@ -178,7 +151,7 @@ class KnowledgeResolver:
 
     def resolve_with_space(self, entry_id: str) -> Optional[Tuple[Path, str]]:
         """Find knowledge entry by relative path ID and return (path, space) tuple."""
-        for search_dir, space in self.get_search_paths():
+        for search_dir, space in self._type_dirs:
             file_path = search_dir / f"{entry_id}.md"
             if file_path.is_file():
                 return (file_path, space)
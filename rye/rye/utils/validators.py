@@ -5,14 +5,16 @@ Loads VALIDATION_SCHEMA from extractors and validates parsed data against it.
 Follows RYE's data-driven architecture pattern.
 """
 
-import ast
 import logging
 import re
 import threading
+from dataclasses import dataclass
+from enum import IntEnum
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Mapping, NamedTuple, Optional, Tuple
 
-from rye.utils.path_utils import get_extractor_search_paths
+from rye.utils.extractor_loader import clear_extractor_cache, load_extractor_metadata
 
 logger = logging.getLogger(__name__)
 
@@ -25,108 +27,40 @@ _validation_lock = threading.RLock()
 _extraction_lock = threading.RLock()
 
 # Global cache: item_type -> validation schema
-_validation_schemas: Optional[Dict[str, Dict[str, Any]]] = None
+# Read without the lock: a loaded cache is a read-only snapshot that is only
+# ever swapped out (to None), never modified in place
+_validation_schemas: Optional[Mapping[str, Dict[str, Any]]] = None
+# Global cache: item_type -> compiled validation schema
+_compiled_schemas: Dict[str, List["FieldValidator"]] = {}
 # Global cache: item_type -> extraction rules
-_extraction_rules: Optional[Dict[str, Dict[str, Any]]] = None
+_extraction_rules: Optional[Mapping[str, Dict[str, Any]]] = None
 
 
 def _load_validation_schemas(
     project_path: Optional[Path] = None,
 ) -> Dict[str, Dict[str, Any]]:
     """Load validation schemas from all extractors."""
-    schemas = {}
-    search_paths = get_extractor_search_paths(project_path)
-
-    for extractors_dir in search_paths:
-        if not extractors_dir.exists():
-            continue
-
-        for file_path in list(extractors_dir.rglob("*_extractor.yaml")) + list(
-            extractors_dir.rglob("*_extractor.py")
-        ):
-            if file_path.name.startswith("_"):
-                continue
-
-            # Extract item type from filename (e.g., directive_extractor.yaml -> directive)
-            item_type = file_path.stem.replace("_extractor", "")
-
-            # Only set if not already set (precedence: project > user > system)
-            if item_type in schemas:
-                continue
-
-            schema = _extract_schema_from_file(file_path)
-            if schema:
-                schemas[item_type] = schema
-
+    schemas = load_extractor_metadata(project_path).validation_schemas
     logger.debug(f"Loaded validation schemas for: {list(schemas.keys())}")
     return schemas
 
 
-def _extract_schema_from_file(file_path: Path) -> Optional[Dict[str, Any]]:
-    """Extract VALIDATION_SCHEMA from an extractor file."""
-    if file_path.suffix in (".yaml", ".yml"):
-        import yaml
-
-        try:
-            data = yaml.safe_load(file_path.read_text())
-            return data.get("validation_schema") if data else None
-        except Exception as e:
-            logger.warning(f"Failed to load YAML schema from {file_path}: {e}")
-            return None
-
-    content = file_path.read_text()
-
-    # Try AST parsing first
-    try:
-        tree = ast.parse(content)
-        for node in tree.body:
-            if isinstance(node, ast.Assign) and len(node.targets) == 1:
-                target = node.targets[0]
-                if isinstance(target, ast.Name) and target.id == "VALIDATION_SCHEMA":
-                    if isinstance(node.value, ast.Dict):
-                        return ast.literal_eval(node.value)
-        return None
-    except SyntaxError as e:
-        logger.warning(f"Syntax error in {file_path}, using regex fallback: {e}")
-        return _extract_schema_regex(content)
-    except Exception as e:
-        logger.warning(f"Failed to extract schema from {file_path}: {e}")
-        return _extract_schema_regex(content)
-
-
-def _extract_schema_regex(content: str) -> Optional[Dict[str, Any]]:
-    """Fallback regex-based schema extraction for malformed files."""
-    # Look for VALIDATION_SCHEMA = {...}
-    # Match simple dict patterns with optional nesting
-    match = re.search(r"VALIDATION_SCHEMA\s*=\s*\{", content)
-    if match:
-        try:
-            # Extract from the match position to end of content
-            start = match.end() - 1  # Include opening brace
-            # Try to find matching closing brace with basic nesting
-            brace_count = 0
-            for i, char in enumerate(content[start:]):
-                if char == "{":
-                    brace_count += 1
-                elif char == "}":
-                    brace_count -= 1
-                    if brace_count == 0:
-                        schema_str = content[start : start + i + 1]
-                        return ast.literal_eval(schema_str)
-        except Exception:
-            pass
-    return None
-
-
 def get_validation_schema(
     item_type: str, project_path: Optional[Path] = None
 ) -> Optional[Dict[str, Any]]:
     """Get validation schema for an item type (thread-safe)."""
     global _validation_schemas
 
+    # Lock-free once loaded
+    schemas = _validation_schemas
+    if schemas is not None:
+        return schemas.get(item_type)
+
     with _validation_lock:
         if _validation_schemas is None:
-            _validation_schemas = _load_validation_schemas(project_path)
+            _validation_schemas = MappingProxyType(
+                _load_validation_schemas(project_path)
+            )
         return _validation_schemas.get(item_type)
 
 
@@ -135,106 +69,35 @@ def clear_validation_schemas_cache():
     global _validation_schemas, _extraction_rules
     with _validation_lock:
         _validation_schemas = None
+        _compiled_schemas.clear()
     with _extraction_lock:
         _extraction_rules = None
+    clear_extractor_cache()
 
 
 def _load_extraction_rules(
     project_path: Optional[Path] = None,
 ) -> Dict[str, Dict[str, Any]]:
     """Load extraction rules from all extractors."""
-    rules = {}
-    search_paths = get_extractor_search_paths(project_path)
-
-    for extractors_dir in search_paths:
-        if not extractors_dir.exists():
-            continue
-
-        for file_path in list(extractors_dir.rglob("*_extractor.yaml")) + list(
-            extractors_dir.rglob("*_extractor.py")
-        ):
-            if file_path.name.startswith("_"):
-                continue
-
-            # Extract item type from filename (e.g., directive_extractor.yaml -> directive)
-            item_type = file_path.stem.replace("_extractor", "")
-
-            # Only set if not already set (precedence: project > user > system)
-            if item_type in rules:
-                continue
-
-            extraction_rules = _extract_rules_from_file(file_path)
-            if extraction_rules:
-                rules[item_type] = extraction_rules
-
+    rules = load_extractor_metadata(project_path).extraction_rules
     logger.debug(f"Loaded extraction rules for: {list(rules.keys())}")
     return rules
 
 
-def _extract_rules_from_file(file_path: Path) -> Optional[Dict[str, Any]]:
-    """Extract EXTRACTION_RULES from an extractor file."""
-    if file_path.suffix in (".yaml", ".yml"):
-        import yaml
-
-        try:
-            data = yaml.safe_load(file_path.read_text())
-            return data.get("extraction_rules") if data else None
-        except Exception as e:
-            logger.warning(f"Failed to load YAML rules from {file_path}: {e}")
-            return None
-
-    content = file_path.read_text()
-
-    # Try AST parsing first
-    try:
-        tree = ast.parse(content)
-        for node in tree.body:
-            if isinstance(node, ast.Assign) and len(node.targets) == 1:
-                target = node.targets[0]
-                if isinstance(target, ast.Name) and target.id == "EXTRACTION_RULES":
-                    if isinstance(node.value, ast.Dict):
-                        return ast.literal_eval(node.value)
-        return None
-    except SyntaxError as e:
-        logger.warning(f"Syntax error in {file_path}, using regex fallback: {e}")
-        return _extract_rules_regex(content)
-    except Exception as e:
-        logger.warning(f"Failed to extract rules from {file_path}: {e}")
-        return _extract_rules_regex(content)
-
-
-def _extract_rules_regex(content: str) -> Optional[Dict[str, Any]]:
-    """Fallback regex-based rules extraction for malformed files."""
-    # Look for EXTRACTION_RULES = {...}
-    match = re.search(r"EXTRACTION_RULES\s*=\s*\{", content)
-    if match:
-        try:
-            # Extract from the match position to end of content
-            start = match.end() - 1  # Include opening brace
-            # Try to find matching closing brace with basic nesting
-            brace_count = 0
-            for i, char in enumerate(content[start:]):
-                if char == "{":
-                    brace_count += 1
-                elif char == "}":
-                    brace_count -= 1
-                    if brace_count == 0:
-                        rules_str = content[start : start + i + 1]
-                        return ast.literal_eval(rules_str)
-        except Exception:
-            pass
-    return None
-
-
 def get_extraction_rules(
     item_type: str, project_path: Optional[Path] = None
 ) -> Optional[Dict[str, Any]]:
     """Get extraction rules for an item type (thread-safe)."""
     global _extraction_rules
 
+    # Lock-free once loaded
+    rules = _extraction_rules
+    if rules is not None:
+        return rules.get(item_type)
+
     with _extraction_lock:
         if _extraction_rules is None:
-            _extraction_rules = _load_extraction_rules(project_path)
+            _extraction_rules = MappingProxyType(_load_extraction_rules(project_path))
         return _extraction_rules.get(item_type)
 
 
@@ -278,6 +141,131 @@ def apply_field_mapping(
     return result
 
 
+class FieldTypeTag(IntEnum):
+    """Schema field types, as stored in compiled schemas."""
+
+    OTHER = 0
+    STRING = 1
+    INTEGER = 2
+    NUMBER = 3
+    BOOLEAN = 4
+    SEMVER = 5
+    ENUM = 6
+    OBJECT = 7
+    ARRAY = 8
+
+
+_TYPE_TAGS = {
+    "string": FieldTypeTag.STRING,
+    "integer": FieldTypeTag.INTEGER,
+    "number": FieldTypeTag.NUMBER,
+    "boolean": FieldTypeTag.BOOLEAN,
+    "semver": FieldTypeTag.SEMVER,
+    "enum": FieldTypeTag.ENUM,
+    "object": FieldTypeTag.OBJECT,
+    "array": FieldTypeTag.ARRAY,
+}
+
+
+@dataclass(frozen=True)
+class FieldValidator:
+    """One schema field with its options looked up ahead of time.
+
+    Built by _compile_field() so that validating many items against the
+    same schema does not repeat the per-field dict lookups.
+    """
+
+    name: str
+    key: str
+    type_tag: FieldTypeTag
+    required: bool
+    nullable: bool
+    snake_case: bool
+    minimum: Any
+    maximum: Any
+    values: Any
+    nested: Tuple["FieldValidator", ...]
+    item_is_object: bool
+    item_required: Any
+    match_filename: bool
+    match_path: bool
+
+
+def _compile_field(
+    field_name: str, field_schema: Dict[str, Any], key: Optional[str] = None
+) -> FieldValidator:
+    """Compile a field schema (and its nested fields) into a FieldValidator.
+
+    field_name is the name used in issue messages ("model.tier" for nested
+    fields); key is the name the value is looked up by, if different.
+    """
+    type_tag = _TYPE_TAGS.get(field_schema.get("type", "string"), FieldTypeTag.OTHER)
+
+    nested: Tuple[FieldValidator, ...] = ()
+    if type_tag == FieldTypeTag.OBJECT:
+        nested = tuple(
+            _compile_field(
+                f"{field_name}.{nested_name}", nested_field_schema, nested_name
+            )
+            for nested_name, nested_field_schema in field_schema.get(
+                "nested", {}
+            ).items()
+        )
+
+    return FieldValidator(
+        name=field_name,
+        key=field_name if key is None else key,
+        type_tag=type_tag,
+        required=bool(field_schema.get("required", False)),
+        nullable=bool(field_schema.get("nullable", False)),
+        snake_case=field_schema.get("format") == "snake_case",
+        minimum=field_schema.get("minimum"),
+        maximum=field_schema.get("maximum"),
+        values=field_schema.get("values", []),
+        nested=nested,
+        item_is_object=field_schema.get("item_type") == "object",
+        item_required=field_schema.get("item_required", []),
+        match_filename=bool(field_schema.get("match_filename")),
+        match_path=bool(field_schema.get("match_path", False)),
+    )
+
+
+def _compile_schema(schema: Dict[str, Any]) -> List[FieldValidator]:
+    """Compile the fields of a validation schema, in schema order."""
+    return [
+        _compile_field(field_name, field_schema)
+        for field_name, field_schema in schema.get("fields", {}).items()
+    ]
+
+
+def _get_compiled_schema(
+    item_type: str, project_path: Optional[Path] = None
+) -> Optional[List[FieldValidator]]:
+    """Get the compiled validation schema for an item type (thread-safe)."""
+    compiled = _compiled_schemas.get(item_type)
+    if compiled is not None:
+        return compiled
+
+    with _validation_lock:
+        compiled = _compiled_schemas.get(item_type)
+        if compiled is None:
+            schema = get_validation_schema(item_type, project_path)
+            if not schema:
+                return None
+            compiled = _compile_schema(schema)
+            _compiled_schemas[item_type] = compiled
+        return compiled
+
+
+class _FieldContext(NamedTuple):
+    """Where the item being validated lives, for the path matching checks."""
+
+    file_path: Optional[Path]
+    item_type: Optional[str]
+    location: str
+    project_path: Optional[Path]
+
+
 def validate_field(
     field_name: str,
     value: Any,
@@ -292,158 +280,190 @@ def validate_field(
 
     Returns list of validation issues (empty if valid).
     """
-    issues = []
-    field_type = field_schema.get("type", "string")
-    required = field_schema.get("required", False)
-    nullable = field_schema.get("nullable", False)
+    issues: List[str] = []
+    _check_field(
+        _compile_field(field_name, field_schema),
+        value,
+        issues,
+        _FieldContext(file_path, item_type, location, project_path),
+    )
+    return issues
+
 
-    # For match_path fields, empty string is valid if it matches the path category
-    # So we check match_path before rejecting empty strings
-    has_match_path = field_schema.get("match_path", False)
+def _check_field(
+    field: FieldValidator,
+    value: Any,
+    issues: List[str],
+    ctx: _FieldContext,
+) -> None:
+    """Validate value against a compiled field, appending issues."""
+    field_name = field.name
 
     # Check required (but allow None for nullable fields, empty string for match_path)
-    if required and value is None and not nullable:
-        issues.append(f"Missing required field: {field_name}")
-        return issues
-    if required and value == [] and not nullable:
-        issues.append(f"Missing required field: {field_name}")
-        return issues
-    if required and value == "" and not has_match_path:
-        issues.append(f"Missing required field: {field_name}")
-        return issues
+    if field.required:
+        if value is None and not field.nullable:
+            issues.append(f"Missing required field: {field_name}")
+            return
+        if value == [] and not field.nullable:
+            issues.append(f"Missing required field: {field_name}")
+            return
+        if value == "" and not field.match_path:
+            issues.append(f"Missing required field: {field_name}")
+            return
 
     # Skip further validation if value is None (and nullable) or empty and not required
     if value is None:
-        return issues
-    if value == "" and not has_match_path:
-        return issues
-
-    # Type validation
-    if field_type == "string":
-        if not isinstance(value, str):
-            issues.append(
-                f"Field '{field_name}' must be a string, got {type(value).__name__}"
-            )
-            return issues
-
-        # Format validation
-        fmt = field_schema.get("format")
-        if fmt == "snake_case" and not SNAKE_CASE_PATTERN.match(value):
-            issues.append(
-                f"Field '{field_name}' must be snake_case "
-                f"(lowercase letters, numbers, underscores, starting with letter), got '{value}'"
-            )
+        return
+    if value == "" and not field.match_path:
+        return
 
-    elif field_type == "integer":
-        if not isinstance(value, int) or isinstance(value, bool):
-            issues.append(
-                f"Field '{field_name}' must be an integer, got {type(value).__name__}"
-            )
-        else:
-            minimum = field_schema.get("minimum")
-            maximum = field_schema.get("maximum")
-            if minimum is not None and value < minimum:
-                issues.append(f"Field '{field_name}' must be >= {minimum}, got {value}")
-            if maximum is not None and value > maximum:
-                issues.append(f"Field '{field_name}' must be <= {maximum}, got {value}")
-
-    elif field_type == "number":
-        if not isinstance(value, (int, float)) or isinstance(value, bool):
-            issues.append(
-                f"Field '{field_name}' must be a number, got {type(value).__name__}"
-            )
-        else:
-            minimum = field_schema.get("minimum")
-            maximum = field_schema.get("maximum")
-            if minimum is not None and value < minimum:
-                issues.append(f"Field '{field_name}' must be >= {minimum}, got {value}")
-            if maximum is not None and value > maximum:
-                issues.append(f"Field '{field_name}' must be <= {maximum}, got {value}")
-
-    elif field_type == "boolean":
-        if not isinstance(value, bool):
-            issues.append(
-                f"Field '{field_name}' must be a boolean, got {type(value).__name__}"
-            )
-
-    elif field_type == "semver":
-        if not isinstance(value, str):
-            issues.append(
-                f"Field '{field_name}' must be a string (semver), got {type(value).__name__}"
-            )
-        elif not SEMVER_PATTERN.match(value):
-            issues.append(
-                f"Field '{field_name}' must be semver format (X.Y.Z), got '{value}'"
-            )
-
-    elif field_type == "enum":
-        valid_values = field_schema.get("values", [])
-        if value not in valid_values:
-            issues.append(
-                f"Field '{field_name}' must be one of {valid_values}, got '{value}'"
-            )
-
-    elif field_type == "object":
-        if not isinstance(value, dict):
-            issues.append(
-                f"Field '{field_name}' must be an object, got {type(value).__name__}"
-            )
-        else:
-            # Validate nested fields
-            nested_schema = field_schema.get("nested", {})
-            for nested_name, nested_field_schema in nested_schema.items():
-                nested_value = value.get(nested_name)
-                nested_issues = validate_field(
-                    f"{field_name}.{nested_name}",
-                    nested_value,
-                    nested_field_schema,
-                    file_path,
-                    item_type,
-                    location,
-                    project_path,
-                )
-                issues.extend(nested_issues)
-
-    elif field_type == "array":
-        if not isinstance(value, list):
-            issues.append(
-                f"Field '{field_name}' must be an array, got {type(value).__name__}"
-            )
-        else:
-            item_type_schema = field_schema.get("item_type")
-            item_required = field_schema.get("item_required", [])
-
-            for i, item in enumerate(value):
-                if item_type_schema == "object":
-                    if not isinstance(item, dict):
-                        issues.append(f"Field '{field_name}[{i}]' must be an object")
-                    else:
-                        for req_field in item_required:
-                            if req_field not in item or not item[req_field]:
-                                issues.append(
-                                    f"Field '{field_name}[{i}]' missing required key '{req_field}'"
-                                )
+    # Type validation; a handler returning True skips the path checks
+    if _TYPE_HANDLERS[field.type_tag](field, value, issues, ctx):
+        return
 
     # Path matching validation
-    if field_schema.get("match_filename") and file_path:
+    file_path = ctx.file_path
+    if field.match_filename and file_path:
         filename = file_path.stem
         if value != filename:
             issues.append(
                 f"Field '{field_name}' value '{value}' must match filename '{filename}'"
             )
 
-    if field_schema.get("match_path") and file_path and item_type:
+    if field.match_path and file_path and ctx.item_type:
         from rye.utils.path_utils import extract_category_path
 
         path_category = extract_category_path(
-            file_path, item_type, location, project_path
+            file_path, ctx.item_type, ctx.location, ctx.project_path
         )
         if value != path_category:
             issues.append(
                 f"Field '{field_name}' value '{value}' must match path category '{path_category}'"
             )
 
-    return issues
+
+def _check_range(field: FieldValidator, value: Any, issues: List[str]) -> None:
+    """Check a numeric value against the field's minimum/maximum."""
+    minimum = field.minimum
+    maximum = field.maximum
+    if minimum is not None and value < minimum:
+        issues.append(f"Field '{field.name}' must be >= {minimum}, got {value}")
+    if maximum is not None and value > maximum:
+        issues.append(f"Field '{field.name}' must be <= {maximum}, got {value}")
+
+
+def _validate_other(field, value, issues, ctx) -> bool:
+    return False
+
+
+def _validate_string(field, value, issues, ctx) -> bool:
+    if not isinstance(value, str):
+        issues.append(
+            f"Field '{field.name}' must be a string, got {type(value).__name__}"
+        )
+        return True
+
+    # Format validation
+    if field.snake_case and not SNAKE_CASE_PATTERN.match(value):
+        issues.append(
+            f"Field '{field.name}' must be snake_case "
+            f"(lowercase letters, numbers, underscores, starting with letter), got '{value}'"
+        )
+    return False
+
+
+def _validate_integer(field, value, issues, ctx) -> bool:
+    if not isinstance(value, int) or isinstance(value, bool):
+        issues.append(
+            f"Field '{field.name}' must be an integer, got {type(value).__name__}"
+        )
+    else:
+        _check_range(field, value, issues)
+    return False
+
+
+def _validate_number(field, value, issues, ctx) -> bool:
+    if not isinstance(value, (int, float)) or isinstance(value, bool):
+        issues.append(
+            f"Field '{field.name}' must be a number, got {type(value).__name__}"
+        )
+    else:
+        _check_range(field, value, issues)
+    return False
+
+
+def _validate_boolean(field, value, issues, ctx) -> bool:
+    if not isinstance(value, bool):
+        issues.append(
+            f"Field '{field.name}' must be a boolean, got {type(value).__name__}"
+        )
+    return False
+
+
+def _validate_semver(field, value, issues, ctx) -> bool:
+    if not isinstance(value, str):
+        issues.append(
+            f"Field '{field.name}' must be a string (semver), got {type(value).__name__}"
+        )
+    elif not SEMVER_PATTERN.match(value):
+        issues.append(
+            f"Field '{field.name}' must be semver format (X.Y.Z), got '{value}'"
+        )
+    return False
+
+
+def _validate_enum(field, value, issues, ctx) -> bool:
+    if value not in field.values:
+        issues.append(
+            f"Field '{field.name}' must be one of {field.values}, got '{value}'"
+        )
+    return False
+
+
+def _validate_object(field, value, issues, ctx) -> bool:
+    if not isinstance(value, dict):
+        issues.append(
+            f"Field '{field.name}' must be an object, got {type(value).__name__}"
+        )
+    else:
+        # Validate nested fields
+        for nested in field.nested:
+            _check_field(nested, value.get(nested.key), issues, ctx)
+    return False
+
+
+def _validate_array(field, value, issues, ctx) -> bool:
+    if not isinstance(value, list):
+        issues.append(
+            f"Field '{field.name}' must be an array, got {type(value).__name__}"
+        )
+    elif field.item_is_object:
+        for i, item in enumerate(value):
+            if not isinstance(item, dict):
+                issues.append(f"Field '{field.name}[{i}]' must be an object")
+            else:
+                for req_field in field.item_required:
+                    if req_field not in item or not item[req_field]:
+                        issues.append(
+                            f"Field '{field.name}[{i}]' missing required key '{req_field}'"
+                        )
+    return False
+
+
+# Indexed by FieldTypeTag
+_TYPE_HANDLERS: Tuple[
+    Callable[[FieldValidator, Any, List[str], _FieldContext], bool], ...
+] = (
+    _validate_other,
+    _validate_string,
+    _validate_integer,
+    _validate_number,
+    _validate_boolean,
+    _validate_semver,
+    _validate_enum,
+    _validate_object,
+    _validate_array,
+)
 
 
 def validate_parsed_data(
@@ -466,29 +486,19 @@ def validate_parsed_data(
     Returns:
         {"valid": bool, "issues": List[str], "warnings": List[str]}
     """
-    issues = []
-    warnings = []
+    issues: List[str] = []
+    warnings: List[str] = []
 
-    schema = get_validation_schema(item_type, project_path)
-    if not schema:
+    compiled = _get_compiled_schema(item_type, project_path)
+    if compiled is None:
         raise ValueError(
             f"Extractor not found for tool type: {item_type}. Extractors should be packaged with their tools."
         )
 
-    fields_schema = schema.get("fields", {})
-
-    for field_name, field_schema in fields_schema.items():
-        value = parsed_data.get(field_name)
-        field_issues = validate_field(
-            field_name,
-            value,
-            field_schema,
-            file_path,
-            item_type,
-            location,
-            project_path,
-        )
-        issues.extend(field_issues)
+    ctx = _FieldContext(file_path, item_type, location, project_path)
+    get = parsed_data.get
+    for field in compiled:
+        _check_field(field, get(field.key), issues, ctx)
 
     return {
         "valid": len(issues) == 0,
@@ -8,14 +8,11 @@ Tests cover:
 """
 
 import pytest
-import sys
 from pathlib import Path
 
-# Add rye to path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / "rye"))
-
 from rye.executor.primitive_executor import PrimitiveExecutor, MAX_CHAIN_DEPTH
 from rye.executor.chain_validator import ChainValidator
+from rye.utils.errors import ErrorResponse
 
 
 class TestChainBuilding:
@@ -144,8 +141,6 @@ class TestErrorHandling:
 
     def test_tool_not_found_error(self):
         """Test tool not found scenario."""
-        from rye.utils.errors import ErrorResponse
-        
         err = ErrorResponse.not_found("tool", "missing_tool")
         result = err.to_dict()
         
@@ -155,8 +150,6 @@ class TestErrorHandling:
 
     def test_execution_failed_error(self):
         """Test execution failure error format."""
-        from rye.utils.errors import ErrorResponse
-        
         err = ErrorResponse.execution_failed("tool_id", "timeout")
         result = err.to_dict()
         
@@ -166,8 +159,6 @@ class TestErrorHandling:
 
     def test_validation_error_details(self):
         """Test validation error includes details."""
-        from rye.utils.errors import ErrorResponse
-        
         issues = ["Field name required", "Version must be semver"]
         err = ErrorResponse.validation_failed(issues, "my_tool")
         result = err.to_dict()
@@ -204,6 +195,33 @@ class TestCacheInvalidation:
         finally:
             test_file.unlink()
 
+    def test_file_hash_reused_until_file_changes(self, monkeypatch):
+        """Test that an unchanged file is not re-hashed."""
+        import os
+        import tempfile
+
+        from rye.utils import path_utils
+
+        # Trust fresh stats as cache keys
+        monkeypatch.setattr(path_utils, "_RACY_MTIME_WINDOW_NS", 0)
+        executor = PrimitiveExecutor()
+
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.py', delete=False) as f:
+            f.write('__version__ = "1.0.0"')
+            test_file = Path(f.name)
+
+        try:
+            # Backdate so the rewrite below is sure to change the mtime
+            os.utime(test_file, (1_000_000, 1_000_000))
+            hash1 = executor._compute_file_hash(test_file)
+            assert str(test_file) in executor._file_hash_cache
+            assert executor._compute_file_hash(test_file) == hash1
+
+            test_file.write_text('__version__ = "2.0.0"')
+            assert executor._compute_file_hash(test_file) != hash1
+        finally:
+            test_file.unlink()
+
     def test_clear_cache_method(self):
         """Test clearing all caches."""
         executor = PrimitiveExecutor()
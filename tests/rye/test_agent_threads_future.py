@@ -3,9 +3,12 @@
 These tests verify data structures, file formats, and protocol logic
 WITHOUT importing implementation modules. They are self-contained
 contract tests derived from docs/rye/design/agent-threads-future.md.
+The transcript peek and partial-line poll tests are the exception: they
+drive the helpers in persistence/transcript.py directly.
 """
 
 import asyncio
+import importlib.util
 import json
 import tempfile
 import threading
@@ -23,6 +26,20 @@ def thread_dir(tmp_path):
 
 THREAD_ID = "planner-1739012900"
 
+TRANSCRIPT_PATH = (
+    Path(__file__).parent.parent.parent
+    / "rye" / "rye" / ".ai" / "tools" / "rye" / "agent" / "threads"
+    / "persistence" / "transcript.py"
+)
+
+
+def _load_transcript_module():
+    """Load persistence/transcript.py, whose peek/poll helpers these tests drive."""
+    spec = importlib.util.spec_from_file_location("thread_transcript", TRANSCRIPT_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
 
 @pytest.mark.asyncio
 class TestContinueThread:
@@ -333,23 +350,62 @@ class TestThreadHandle:
         assert done.is_set()
         assert isinstance(error, RuntimeError)
 
-    def test_handle_peek_transcript(self, thread_dir):
-        """peek_transcript reads latest N entries from running thread."""
+    def test_handle_peek_transcript(self, thread_dir, monkeypatch):
+        """peek_transcript reads latest N entries without reading the whole file."""
+        transcript_mod = _load_transcript_module()
         jsonl_path = thread_dir / THREAD_ID / "transcript.jsonl"
         jsonl_path.parent.mkdir(parents=True)
         events = [
             {"ts": f"T{i}", "type": "assistant_text", "text": f"msg {i}"}
-            for i in range(10)
+            for i in range(10_000)
         ]
         jsonl_path.write_text(
             "\n".join(json.dumps(e) for e in events) + "\n"
+            + '{"ts": "T10000", "type": "assistant_te'  # still being written
         )
-        with open(jsonl_path) as f:
-            lines = f.readlines()
-        last_5 = [json.loads(l.strip()) for l in lines[-5:] if l.strip()]
-        assert len(last_5) == 5
-        assert last_5[0]["text"] == "msg 5"
-        assert last_5[-1]["text"] == "msg 9"
+
+        bytes_read = []
+        real_open = open
+
+        class CountingFile:
+            def __init__(self, f):
+                self._f = f
+
+            def read(self, *args):
+                data = self._f.read(*args)
+                bytes_read.append(len(data))
+                return data
+
+            def __getattr__(self, name):
+                return getattr(self._f, name)
+
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *exc):
+                return self._f.__exit__(*exc)
+
+        monkeypatch.setattr(
+            transcript_mod, "open",
+            lambda *a, **kw: CountingFile(real_open(*a, **kw)),
+            raising=False,
+        )
+        last_5 = transcript_mod.read_tail(jsonl_path, 5, block_size=64)
+
+        assert [e["text"] for e in last_5] == [f"msg {i}" for i in range(9995, 10_000)]
+        assert 0 < sum(bytes_read) < jsonl_path.stat().st_size // 100
+
+    def test_handle_peek_short_transcript(self, thread_dir):
+        """Asking for more entries than exist returns the whole transcript."""
+        transcript_mod = _load_transcript_module()
+        jsonl_path = thread_dir / THREAD_ID / "transcript.jsonl"
+        jsonl_path.parent.mkdir(parents=True)
+        jsonl_path.write_text('{"ts":"T1"}\n{"ts":"T2"}\n')
+
+        assert transcript_mod.read_tail(jsonl_path, 5, block_size=4) == [
+            {"ts": "T1"}, {"ts": "T2"},
+        ]
+        assert transcript_mod.read_tail(thread_dir / "missing.jsonl", 5) == []
 
     def test_handle_status_from_thread_json(self, thread_dir):
         """Handle reads status from thread.json."""
@@ -536,6 +592,55 @@ class TestTranscriptWatcher:
         assert len(events) == 1
         assert events[0]["type"] == "assistant_text"
 
+    def test_poll_holds_partial_line(self, thread_dir, monkeypatch):
+        """A line still being written is held until its newline arrives."""
+        transcript_mod = _load_transcript_module()
+        jsonl_path = thread_dir / THREAD_ID / "transcript.jsonl"
+        jsonl_path.parent.mkdir(parents=True)
+        jsonl_path.write_text('{"ts":"T1","type":"thread_start"}\n{"ts":"T2",')
+
+        opened = []
+        real_open = open
+
+        def counting_open(*args, **kwargs):
+            opened.append(args[0])
+            return real_open(*args, **kwargs)
+
+        monkeypatch.setattr(transcript_mod, "open", counting_open, raising=False)
+        watcher = transcript_mod.TranscriptWatcher(jsonl_path)
+        try:
+            events = watcher.poll()
+            assert [e["ts"] for e in events] == ["T1"]
+
+            with open(jsonl_path, "a") as w:
+                w.write('"type":"assistant_text",')
+            assert watcher.poll() == []
+
+            with open(jsonl_path, "a") as w:
+                w.write('"text":"New"}\n{"ts":"T3"}\n')
+            events = watcher.poll()
+            assert [e["ts"] for e in events] == ["T2", "T3"]
+            assert events[0]["text"] == "New"
+            assert watcher.poll() == []
+        finally:
+            watcher.close()
+
+        # One handle kept open across every poll
+        assert opened == [jsonl_path]
+
+    def test_poll_missing_transcript(self, thread_dir):
+        """Polling before the thread has written anything returns nothing."""
+        transcript_mod = _load_transcript_module()
+        jsonl_path = thread_dir / "transcript.jsonl"
+        watcher = transcript_mod.TranscriptWatcher(jsonl_path)
+        try:
+            assert watcher.poll() == []
+
+            jsonl_path.write_text('{"ts":"T1"}\n')
+            assert watcher.poll() == [{"ts": "T1"}]
+        finally:
+            watcher.close()
+
     def test_poll_empty_when_no_changes(self, thread_dir):
         """Poll returns empty list when no new events."""
         jsonl_path = thread_dir / THREAD_ID / "transcript.jsonl"
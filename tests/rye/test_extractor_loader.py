@@ -0,0 +1,229 @@
+"""Tests for extractor loading and per-file caching."""
+
+import importlib.util
+import os
+from pathlib import Path
+
+import pytest
+
+from rye.utils import extractor_loader, path_utils
+from rye.utils.extractor_loader import (
+    DEFAULT_SIGNATURE_FORMAT,
+    clear_extractor_cache,
+    clear_extractor_file_cache,
+    load_cached,
+    load_extractor_metadata,
+)
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache(monkeypatch):
+    """Start each test with an empty cache and no racy-timestamp window."""
+    monkeypatch.setattr(path_utils, "_RACY_MTIME_WINDOW_NS", 0)
+    clear_extractor_file_cache()
+    clear_extractor_cache()
+    yield
+    clear_extractor_file_cache()
+    clear_extractor_cache()
+
+
+@pytest.fixture
+def yaml_extractor(tmp_path):
+    path = tmp_path / "tool_extractor.yaml"
+    path.write_text(
+        "extensions: [.py]\n"
+        "validation_schema:\n"
+        "  fields:\n"
+        "    name: {required: true}\n"
+    )
+    return path
+
+
+class _CountingExtract:
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, path):
+        self.calls += 1
+        return extractor_loader._read_yaml_extractor(path)
+
+
+def test_unchanged_file_is_extracted_once(yaml_extractor):
+    extract = _CountingExtract()
+
+    first = load_cached(yaml_extractor, "yaml", extract)
+    second = load_cached(yaml_extractor, "yaml", extract)
+
+    assert extract.calls == 1
+    assert first == second
+
+
+def test_edit_invalidates_cached_result(yaml_extractor):
+    extract = _CountingExtract()
+    load_cached(yaml_extractor, "yaml", extract)
+
+    st = yaml_extractor.stat()
+    yaml_extractor.write_text(yaml_extractor.read_text().replace(".py", ".rb"))
+    # Move mtime forward explicitly so coarse timestamps still differ
+    os.utime(yaml_extractor, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+    result = load_cached(yaml_extractor, "yaml", extract)
+
+    assert extract.calls == 2
+    assert result["extensions"] == [".rb"]
+
+
+def test_recently_written_file_is_not_cached(yaml_extractor, monkeypatch):
+    monkeypatch.setattr(path_utils, "_RACY_MTIME_WINDOW_NS", 60_000_000_000)
+    extract = _CountingExtract()
+
+    load_cached(yaml_extractor, "yaml", extract)
+    load_cached(yaml_extractor, "yaml", extract)
+
+    assert extract.calls == 2
+    assert extractor_loader._file_cache == {}
+
+
+def test_callers_do_not_share_cached_objects(yaml_extractor):
+    extract = _CountingExtract()
+
+    first = load_cached(yaml_extractor, "yaml", extract)
+    first["extensions"].append(".sh")
+    first["validation_schema"]["fields"].clear()
+    second = load_cached(yaml_extractor, "yaml", extract)
+
+    assert extract.calls == 1
+    assert second["extensions"] == [".py"]
+    assert second["validation_schema"]["fields"] == {"name": {"required": True}}
+    assert second is not first
+
+
+def test_registry_mutation_does_not_leak_into_cache(tmp_path, monkeypatch):
+    extractors_dir = tmp_path / "extractors"
+    extractors_dir.mkdir()
+    (extractors_dir / "tool_extractor.yaml").write_text(
+        "extensions: [.py]\nextraction_rules:\n  name: {type: filename}\n"
+    )
+    monkeypatch.setattr(
+        extractor_loader, "get_extractor_search_paths", lambda _: [extractors_dir]
+    )
+    extractor_loader.clear_extractor_cache()
+    try:
+        rules = extractor_loader.load_extractor_metadata(tmp_path).extraction_rules
+        rules["tool"]["name"]["type"] = "changed"
+        extractor_loader.clear_extractor_cache()
+
+        reloaded = extractor_loader.load_extractor_metadata(tmp_path).extraction_rules
+    finally:
+        extractor_loader.clear_extractor_cache()
+
+    assert reloaded["tool"] == {"name": {"type": "filename"}}
+
+
+# Bundled extractors, compared against reading each file directly: YAML via
+# yaml.safe_load and Python by importing the module, as the loaders did
+# before AST extraction and per-file caching.
+
+BUNDLED_EXTRACTORS = (
+    Path(extractor_loader.__file__).parent.parent
+    / ".ai" / "tools" / "rye" / "core" / "extractors"
+)
+
+
+def _bundled_yaml():
+    import yaml
+
+    files = sorted(BUNDLED_EXTRACTORS.rglob("*_extractor.yaml"))
+    assert files, "no bundled extractors found"
+    return [(path, yaml.safe_load(path.read_text())) for path in files]
+
+
+def _import_extractor(path):
+    spec = importlib.util.spec_from_file_location(f"_extractor_{path.stem}", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return {
+        "extensions": getattr(module, "EXTENSIONS", []),
+        "signature_format": getattr(module, "SIGNATURE_FORMAT", None),
+        "validation_schema": getattr(module, "VALIDATION_SCHEMA", None),
+        "extraction_rules": getattr(module, "EXTRACTION_RULES", None),
+    }
+
+
+def _expected_registries(tiers):
+    """Merge (path, top_level, data) entries per tier, first value wins."""
+    formats, schemas, rules = {}, {}, {}
+    for entries in tiers:
+        for path, top_level, data in entries:
+            if top_level and data.get("extensions"):
+                sig_format = data.get("signature_format", DEFAULT_SIGNATURE_FORMAT)
+                for ext in data["extensions"]:
+                    formats.setdefault(ext.lower(), sig_format)
+            item_type = path.stem.replace("_extractor", "")
+            if data.get("validation_schema"):
+                schemas.setdefault(item_type, data["validation_schema"])
+            if data.get("extraction_rules"):
+                rules.setdefault(item_type, data["extraction_rules"])
+    return formats, schemas, rules
+
+
+def _system_tier():
+    return [
+        (path, path.parent == BUNDLED_EXTRACTORS, data) for path, data in _bundled_yaml()
+    ]
+
+
+@pytest.fixture
+def python_extractors(tmp_path):
+    """Project-level Python ports of the bundled YAML extractors."""
+    project = tmp_path / "project"
+    extractors_dir = project / ".ai" / "tools" / "rye" / "core" / "extractors"
+    extractors_dir.mkdir(parents=True)
+    for path, data in _bundled_yaml():
+        (extractors_dir / f"{path.stem}.py").write_text(
+            "import os\n\n"
+            f"EXTENSIONS = {data['extensions']!r}\n"
+            f"SIGNATURE_FORMAT = {data['signature_format']!r}\n"
+            f"VALIDATION_SCHEMA = {data['validation_schema']!r}\n"
+            f"EXTRACTION_RULES = {data['extraction_rules']!r}\n\n\n"
+            "def extract(path):\n"
+            "    return os.path.basename(path)\n"
+        )
+    return project, extractors_dir
+
+
+def test_bundled_extractors_match_direct_load():
+    from rye.utils import extensions, signature_formats, validators
+
+    formats, schemas, rules = _expected_registries([_system_tier()])
+    metadata = load_extractor_metadata(None)
+
+    assert metadata.signature_formats == formats
+    assert metadata.validation_schemas == schemas
+    assert metadata.extraction_rules == rules
+    assert signature_formats._load_signature_formats(None) == formats
+    assert dict(validators._load_validation_schemas(None)) == schemas
+    assert dict(validators._load_extraction_rules(None)) == rules
+
+    expected_extensions = {
+        ext for _, data in _bundled_yaml() for ext in data.get("extensions", [])
+    }
+    loaded = extensions.get_tool_extensions(None, force_reload=True)
+    extensions.clear_extensions_cache()
+    assert set(loaded) == expected_extensions
+
+
+def test_python_extractors_match_imported_modules(python_extractors):
+    project, extractors_dir = python_extractors
+    project_tier = [
+        (path, True, _import_extractor(path))
+        for path in sorted(extractors_dir.glob("*_extractor.py"))
+    ]
+
+    formats, schemas, rules = _expected_registries([project_tier, _system_tier()])
+    metadata = load_extractor_metadata(project)
+
+    assert formats
+    assert metadata.signature_formats == formats
+    assert metadata.validation_schemas == schemas
+    assert metadata.extraction_rules == rules
@@ -163,3 +163,66 @@ class TestLoadTool:
 
         assert result["status"] == "success"
         assert "Shared tool" in result["content"]
+
+
+class TestReadItem:
+    """Reading item content, including the mmap path for large files."""
+
+    @pytest.fixture
+    def mmap_calls(self, monkeypatch):
+        import mmap
+        from types import SimpleNamespace
+
+        from rye.tools import load
+
+        calls = []
+
+        def _mmap(*args, **kwargs):
+            calls.append(args)
+            return mmap.mmap(*args, **kwargs)
+
+        monkeypatch.setattr(
+            load, "mmap", SimpleNamespace(mmap=_mmap, ACCESS_READ=mmap.ACCESS_READ)
+        )
+        return calls
+
+    def test_large_file_with_crlf_matches_read_text(self, tmp_path, mmap_calls):
+        from rye.tools.load import _MMAP_THRESHOLD, _read_item
+
+        path = tmp_path / "big.md"
+        line = "café — line\r\n"
+        body = line * (_MMAP_THRESHOLD // len(line.encode()) + 1)
+        path.write_bytes((body + "lone\rcr\rend").encode("utf-8"))
+        assert path.stat().st_size >= _MMAP_THRESHOLD
+
+        content = _read_item(path)
+
+        assert len(mmap_calls) == 1
+        assert content == path.read_text(encoding="utf-8")
+        assert "\r" not in content
+
+    def test_threshold_boundary(self, tmp_path, mmap_calls):
+        from rye.tools.load import _MMAP_THRESHOLD, _read_item
+
+        below = tmp_path / "below.md"
+        below.write_bytes(b"a\r\n" + b"x" * (_MMAP_THRESHOLD - 5) + b"\n")
+        at = tmp_path / "at.md"
+        at.write_bytes(b"a\r\n" + b"x" * (_MMAP_THRESHOLD - 3))
+        assert below.stat().st_size == _MMAP_THRESHOLD - 1
+        assert at.stat().st_size == _MMAP_THRESHOLD
+
+        assert _read_item(below) == below.read_text(encoding="utf-8")
+        assert mmap_calls == []
+        assert _read_item(at) == at.read_text(encoding="utf-8")
+        assert len(mmap_calls) == 1
+
+    def test_empty_file_skips_mmap(self, tmp_path, mmap_calls):
+        from rye.tools.load import _MMAP_THRESHOLD, _read_item
+
+        path = tmp_path / "empty.md"
+        path.write_bytes(b"")
+
+        # mmap cannot map a zero-length file
+        assert _MMAP_THRESHOLD > 0
+        assert _read_item(path) == ""
+        assert mmap_calls == []
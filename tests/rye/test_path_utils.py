@@ -0,0 +1,72 @@
+"""Tests for path_utils file lookup."""
+
+import os
+from types import SimpleNamespace
+
+import pytest
+
+from rye.utils import path_utils
+from rye.utils.path_utils import find_file_by_stem
+
+
+@pytest.fixture
+def tree(tmp_path):
+    for rel in [
+        "alpha.yaml",
+        "nested/alpha.py",
+        "other/alpha.json",
+        "pkg/sub/beta.md",
+        "pkg/beta.md",
+        "notpkg/sub/beta.md",
+        "gamma.txt",
+    ]:
+        path = tmp_path / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(rel)
+    return tmp_path
+
+
+def test_first_extension_wins_regardless_of_depth(tree):
+    found = find_file_by_stem(tree, "alpha", [".py", ".yaml", ".json"])
+
+    assert found == tree / "nested" / "alpha.py"
+
+
+def test_best_rank_returned_when_first_extension_missing(tree):
+    assert find_file_by_stem(tree, "alpha", [".md", ".json", ".yaml"]) == (
+        tree / "other" / "alpha.json"
+    )
+    assert find_file_by_stem(tree, "alpha", [".md", ".yaml", ".json"]) == (
+        tree / "alpha.yaml"
+    )
+
+
+def test_rank_zero_match_stops_the_walk(tmp_path, monkeypatch):
+    def _entry(rel):
+        return SimpleNamespace(name=os.path.basename(rel), path=str(tmp_path / rel))
+
+    def _walk(root):
+        yield _entry("a/item.yaml")
+        yield _entry("b/item.py")
+        raise AssertionError("walk continued after a rank 0 match")
+
+    monkeypatch.setattr(path_utils, "iter_files", _walk)
+
+    assert find_file_by_stem(tmp_path, "item", [".py", ".yaml"]) == tmp_path / "b" / "item.py"
+
+
+def test_parent_suffix_must_match_trailing_dirs(tree):
+    assert find_file_by_stem(tree, "pkg/sub/beta", [".md"]) == tree / "pkg" / "sub" / "beta.md"
+    assert find_file_by_stem(tree, "sub/beta", [".md"]) in {
+        tree / "pkg" / "sub" / "beta.md",
+        tree / "notpkg" / "sub" / "beta.md",
+    }
+    # "kg" ends the string "pkg" but is not a directory on the path
+    assert find_file_by_stem(tree, "kg/beta", [".md"]) is None
+    assert find_file_by_stem(tree, "notpkg/beta", [".md"]) is None
+
+
+def test_missing_stem_returns_none(tree):
+    assert find_file_by_stem(tree, "delta", [".py", ".yaml"]) is None
+    assert find_file_by_stem(tree, "gamma", [".py", ".yaml"]) is None
+    assert find_file_by_stem(tree / "absent", "alpha", [".py"]) is None
@@ -232,3 +232,344 @@ class TestSearchTool:
             assert "preview" in item
             assert "source" in item
             assert "path" in item
+
+    async def test_modified_file_is_re_extracted(self, temp_project):
+        tool = SearchTool("")
+        first = await tool.handle(
+            item_type="directive",
+            query="deploy",
+            project_path=str(temp_project),
+            source="project",
+        )
+        assert first["total"] == 0
+
+        (temp_project / ".ai" / "directives" / "bootstrap.md").write_text(
+            '<directive name="bootstrap" version="1.0.0">\n'
+            '<metadata><description>Deploy project</description></metadata>\n'
+            '</directive>'
+        )
+        second = await tool.handle(
+            item_type="directive",
+            query="deploy",
+            project_path=str(temp_project),
+            source="project",
+        )
+        assert second["total"] == 1
+        assert second["results"][0]["name"] == "bootstrap"
+
+    async def test_fuzzy_search(self, temp_project):
+        tool = SearchTool("")
+        exact = await tool.handle(
+            item_type="directive",
+            query="bootstrp",
+            project_path=str(temp_project),
+            source="project",
+        )
+        fuzzy = await tool.handle(
+            item_type="directive",
+            query="bootstrp",
+            fuzzy={"enabled": True, "max_distance": 1},
+            project_path=str(temp_project),
+            source="project",
+        )
+
+        assert exact["total"] == 0
+        assert any(r["name"] == "bootstrap" for r in fuzzy["results"])
+
+    async def test_partial_word_matches(self, temp_project):
+        tool = SearchTool("")
+        result = await tool.handle(
+            item_type="directive",
+            query="strap",
+            project_path=str(temp_project),
+            source="project",
+        )
+
+        assert any(r["name"] == "bootstrap" for r in result["results"])
+
+
+class TestMetadataCache:
+    """Caching of extracted metadata between searches."""
+
+    @pytest.fixture(autouse=True)
+    def _clean_cache(self, monkeypatch):
+        from rye.tools.search import clear_search_cache
+        from rye.utils import path_utils
+        from rye.utils.integrity import clear_verified_cache
+
+        # Trust fresh stats as cache keys
+        monkeypatch.setattr(path_utils, "_RACY_MTIME_WINDOW_NS", 0)
+        clear_search_cache()
+        clear_verified_cache()
+        yield
+        clear_search_cache()
+        clear_verified_cache()
+
+    @pytest.fixture
+    def signed_tool(self, temp_project):
+        from rye.constants import ItemType
+        from rye.utils.metadata_manager import MetadataManager
+
+        path = temp_project / ".ai" / "tools" / "signed.py"
+        path.write_text(
+            MetadataManager.sign_content(
+                ItemType.TOOL, '__version__ = "1.0.0"\n', file_path=path
+            )
+        )
+        return path
+
+    def _extract(self, temp_project, path, project_path=None):
+        from rye.tools.search import MetadataExtractor
+
+        extractor = MetadataExtractor(project_path)
+        return extractor.extract(path, "tool", temp_project / ".ai" / "tools")
+
+    def test_trust_rederived_after_key_revoked(self, temp_project, signed_tool):
+        from rye.tools import search
+        from rye.utils.trust_store import TrustStore
+
+        first = self._extract(temp_project, signed_tool)
+        assert first["signed"] is True
+        assert len(search._metadata_cache) == 1
+
+        for fingerprint in [p.stem for p in TrustStore().trust_dir.glob("*.pem")]:
+            TrustStore().remove_key(fingerprint)
+
+        second = self._extract(temp_project, signed_tool)
+        assert second["signed"] is False
+        assert second["integrity"] is None
+
+    def test_cached_entry_has_no_trust_fields(self, temp_project, signed_tool):
+        from rye.tools import search
+
+        self._extract(temp_project, signed_tool)
+        (_, _, cached), = search._metadata_cache.values()
+        assert "signed" not in cached
+        assert "integrity" not in cached
+
+    def test_recently_written_file_not_cached(
+        self, temp_project, signed_tool, monkeypatch
+    ):
+        from rye.tools import search
+        from rye.utils import path_utils
+
+        monkeypatch.setattr(path_utils, "_RACY_MTIME_WINDOW_NS", 60 * 10**9)
+        self._extract(temp_project, signed_tool)
+        assert search._metadata_cache == {}
+
+    def test_cache_keyed_by_project_path(self, temp_project, signed_tool):
+        from rye.tools import search
+
+        self._extract(temp_project, signed_tool)
+        self._extract(temp_project, signed_tool, project_path=temp_project)
+        project_keys = {key[3] for key in search._metadata_cache}
+        assert project_keys == {None, str(temp_project)}
+
+    async def _search(self, temp_project):
+        return await SearchTool("").handle(
+            item_type="directive",
+            query="create",
+            project_path=str(temp_project),
+            source="project",
+        )
+
+    @pytest.mark.asyncio
+    async def test_index_cache_keyed_by_project_path(self, temp_project):
+        from rye.tools import search
+
+        await self._search(temp_project)
+        assert search._index_cache
+        assert all(key[2] == str(temp_project) for key in search._index_cache)
+
+    @pytest.mark.asyncio
+    async def test_index_not_cached_for_recent_files(
+        self, temp_project, monkeypatch
+    ):
+        from rye.tools import search
+        from rye.utils import path_utils
+
+        monkeypatch.setattr(path_utils, "_RACY_MTIME_WINDOW_NS", 60 * 10**9)
+        result = await self._search(temp_project)
+        assert result["total"] >= 1
+        assert search._index_cache == {}
+
+
+class TestParallelExtraction:
+    """Thread-pool extraction of many uncached files."""
+
+    @pytest.fixture
+    def many_directives(self, temp_project):
+        from rye.tools.search import _PARALLEL_EXTRACT_MIN_FILES, clear_search_cache
+
+        clear_search_cache()
+        directives_dir = temp_project / ".ai" / "directives"
+        for i in range(_PARALLEL_EXTRACT_MIN_FILES * 2):
+            (directives_dir / f"bulk_{i}.md").write_text(
+                f'<directive name="bulk_{i}" version="1.0.0">\n'
+                f"<metadata><description>Bulk item {i}</description></metadata>\n"
+                "</directive>"
+            )
+        yield temp_project
+        clear_search_cache()
+
+    def _extract_all(self, project):
+        from rye.tools.search import MetadataExtractor
+
+        directives_dir = project / ".ai" / "directives"
+        files = [(p, p.stat()) for p in sorted(directives_dir.glob("*.md"))]
+        return MetadataExtractor(project).extract_many(files, "directive", directives_dir)
+
+    def test_parser_loaded_before_workers_start(self, many_directives, monkeypatch):
+        from rye.utils.parser_router import ParserRouter
+
+        original = ParserRouter._load_parser
+        cold_loads = []
+
+        def _load_parser(self, parser_name):
+            if parser_name not in self._parsers:
+                cold_loads.append(parser_name)
+            return original(self, parser_name)
+
+        monkeypatch.setattr(ParserRouter, "_load_parser", _load_parser)
+        results = self._extract_all(many_directives)
+
+        assert all(r is not None for r in results)
+        assert len(cold_loads) == 1
+
+    def test_pool_size_is_bounded(self, many_directives, monkeypatch):
+        from rye.tools import search
+
+        sizes = []
+        real_pool = search.ThreadPoolExecutor
+
+        def _pool(*args, **kwargs):
+            sizes.append(kwargs.get("max_workers"))
+            return real_pool(*args, **kwargs)
+
+        monkeypatch.setattr(search, "ThreadPoolExecutor", _pool)
+        self._extract_all(many_directives)
+
+        assert sizes == [search._PARALLEL_EXTRACT_MAX_WORKERS]
+
+
+def _import_search_without(monkeypatch, *missing):
+    """Load a fresh copy of rye.tools.search with the given modules unimportable."""
+    import importlib.util
+    import sys
+
+    from rye.tools import search
+
+    for name in missing:
+        monkeypatch.setitem(sys.modules, name, None)
+    spec = importlib.util.spec_from_file_location("_search_fallback", search.__file__)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class TestTermScan:
+    """One-pass literal scan with and without pyahocorasick."""
+
+    QUERIES = [
+        "create",
+        "create AND tool",
+        "(alpha OR beta) AND NOT gamma",
+        '"create tool" OR deploy',
+        "he AND she AND hers AND his",
+        "a AND ab AND abc AND bc",
+    ]
+    TEXTS = [
+        "",
+        "Create a new tool",
+        "alpha beta gamma",
+        "deploy the create tool",
+        "ushers",
+        "xabcx",
+        "nothing relevant here",
+    ]
+
+    def test_fallback_used_when_pyahocorasick_missing(self, monkeypatch):
+        fallback = _import_search_without(monkeypatch, "ahocorasick")
+
+        assert fallback.AHOCORASICK_AVAILABLE is False
+        compiled = fallback._parse_query("create AND tool")
+        assert compiled._automaton is None
+        assert compiled.scan("create a tool") == {"create", "tool"}
+
+    def test_automaton_and_fallback_agree(self, monkeypatch):
+        pytest.importorskip("ahocorasick")
+        from rye.tools import search
+
+        fallback = _import_search_without(monkeypatch, "ahocorasick")
+
+        for query in self.QUERIES:
+            fast = search.CompiledQuery(search.QueryParser(query).parse())
+            slow = fallback.CompiledQuery(fallback.QueryParser(query).parse())
+            if len(fast._terms) > 1:
+                assert fast._automaton is not None
+            assert slow._automaton is None
+            for text in self.TEXTS:
+                assert fast.scan(text.lower()) == slow.scan(text.lower()), (query, text)
+                assert fast.matches(text) == slow.matches(text), (query, text)
+
+    def test_overlapping_terms_all_reported(self):
+        from rye.tools.search import _parse_query
+
+        compiled = _parse_query("he AND she AND hers AND his")
+
+        assert compiled.scan("ushers") == {"he", "she", "hers"}
+        assert compiled.matches("ushers his") is True
+        assert compiled.matches("ushers") is False
+
+
+class TestLevenshteinFallback:
+    """Fuzzy matching with and without rapidfuzz."""
+
+    PAIRS = [
+        ("", ""),
+        ("", "abc"),
+        ("bootstrap", "bootstrp"),
+        ("kitten", "sitting"),
+        ("flaw", "lawn"),
+        ("deploy", "deploy"),
+        ("search", "research"),
+        ("abcdef", "uvwxyz"),
+    ]
+
+    def test_distances_match_without_rapidfuzz(self, monkeypatch):
+        pytest.importorskip("rapidfuzz")
+        from rye.tools import search
+
+        fallback = _import_search_without(monkeypatch, "rapidfuzz", "rapidfuzz.distance")
+
+        assert search.RAPIDFUZZ_AVAILABLE is True
+        assert fallback.RAPIDFUZZ_AVAILABLE is False
+        for a, b in self.PAIRS:
+            assert fallback.levenshtein_distance(a, b) == search.levenshtein_distance(a, b)
+            for cutoff in (0, 1, 2):
+                # Distances above the cutoff only need to agree that they exceed it
+                fast = min(search.levenshtein_distance(a, b, cutoff), cutoff + 1)
+                slow = min(fallback.levenshtein_distance(a, b, cutoff), cutoff + 1)
+                assert fast == slow, (a, b, cutoff)
+
+    @pytest.mark.asyncio
+    async def test_fuzzy_results_match_without_rapidfuzz(self, temp_project, monkeypatch):
+        pytest.importorskip("rapidfuzz")
+        from rye.tools import search
+
+        fallback = _import_search_without(monkeypatch, "rapidfuzz", "rapidfuzz.distance")
+
+        async def _fuzzy(module):
+            result = await module.SearchTool("").handle(
+                item_type="directive",
+                query="bootstrp OR dploy",
+                fuzzy={"enabled": True, "max_distance": 2},
+                project_path=str(temp_project),
+                source="project",
+            )
+            return [(r["name"], r["score"]) for r in result["results"]]
+
+        expected = await _fuzzy(search)
+
+        assert expected
+        assert await _fuzzy(fallback) == expected
@@ -0,0 +1,76 @@
+"""Tests for integrity verification caching."""
+
+import os
+import time
+from pathlib import Path
+
+import pytest
+
+from rye.constants import ItemType
+from rye.utils import integrity, path_utils
+from rye.utils.integrity import IntegrityError, clear_verified_cache, verify_item
+from rye.utils.metadata_manager import MetadataManager
+from rye.utils.trust_store import TrustStore
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache(monkeypatch):
+    """Start each test with an empty cache and no racy-timestamp window."""
+    monkeypatch.setattr(path_utils, "_RACY_MTIME_WINDOW_NS", 0)
+    clear_verified_cache()
+    yield
+    clear_verified_cache()
+
+
+@pytest.fixture
+def signed_tool(tmp_path):
+    """A signed Python tool file."""
+    path = tmp_path / "tool.py"
+    content = '__version__ = "1.0.0"\nprint("one")\n'
+    path.write_text(MetadataManager.sign_content(ItemType.TOOL, content, file_path=path))
+    return path
+
+
+def _fail_read(*args, **kwargs):
+    raise AssertionError("file was re-read")
+
+
+def test_unchanged_file_is_served_from_cache(signed_tool, monkeypatch):
+    first = verify_item(signed_tool, ItemType.TOOL)
+    assert len(integrity._verified_cache) == 1
+
+    monkeypatch.setattr(Path, "read_text", _fail_read)
+    assert verify_item(signed_tool, ItemType.TOOL) == first
+
+
+def test_edit_with_restored_mtime_is_reverified(signed_tool):
+    verify_item(signed_tool, ItemType.TOOL)
+    st = os.stat(signed_tool)
+
+    # Wait out coarse kernel timestamps so the rewrite gets a new ctime
+    time.sleep(0.05)
+    # Same size, same mtime: only inode metadata gives the edit away
+    tampered = signed_tool.read_text().replace('"one"', '"two"')
+    signed_tool.write_text(tampered)
+    os.utime(signed_tool, ns=(st.st_atime_ns, st.st_mtime_ns))
+    assert os.stat(signed_tool).st_size == st.st_size
+
+    with pytest.raises(IntegrityError, match="Integrity failed"):
+        verify_item(signed_tool, ItemType.TOOL)
+
+
+def test_revoked_key_is_rejected_despite_cache(signed_tool):
+    verify_item(signed_tool, ItemType.TOOL)
+    fingerprint = MetadataManager.get_signature_info(
+        ItemType.TOOL, signed_tool.read_text(), file_path=signed_tool
+    )["pubkey_fp"]
+
+    assert TrustStore().remove_key(fingerprint)
+    with pytest.raises(IntegrityError):
+        verify_item(signed_tool, ItemType.TOOL)
+
+
+def test_recently_written_file_is_not_cached(signed_tool, monkeypatch):
+    monkeypatch.setattr(path_utils, "_RACY_MTIME_WINDOW_NS", 60 * 10**9)
+    verify_item(signed_tool, ItemType.TOOL)
+    assert integrity._verified_cache == {}